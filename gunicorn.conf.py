@@ -1 +1,9 @@
+import os
+
 timeout = 120  # seconds
+
+# Threaded workers let requests blocked on Postgres, S3 or Spoonacular overlap
+# inside one process; keep threads within DB_POOL_SIZE so each can hold a
+# connection. Gunicorn reads WEB_CONCURRENCY for the process count.
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", "8"))
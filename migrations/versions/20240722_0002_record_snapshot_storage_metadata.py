@@ -19,21 +19,37 @@ depends_on = None
 
 
 def upgrade() -> None:
-    op.add_column(
-        "fridge_snapshots",
-        sa.Column("image_bucket", sa.String(length=255), nullable=False),
+    # One ALTER TABLE takes the exclusive lock once for all column changes.
+    # The new columns start nullable so existing rows can be backfilled.
+    op.execute(
+        """
+        ALTER TABLE fridge_snapshots
+            ADD COLUMN image_bucket VARCHAR(255),
+            ADD COLUMN image_key VARCHAR(512),
+            ADD COLUMN image_filename VARCHAR(255),
+            DROP COLUMN captured_at,
+            DROP COLUMN source,
+            DROP COLUMN raw_response
+        """
     )
-    op.add_column(
-        "fridge_snapshots",
-        sa.Column("image_key", sa.String(length=512), nullable=False),
+    op.execute(
+        """
+        UPDATE fridge_snapshots
+        SET image_bucket = '', image_key = '', image_filename = ''
+        """
     )
-    op.add_column(
-        "fridge_snapshots",
-        sa.Column("image_filename", sa.String(length=255), nullable=False),
+
+    # The ALTER and backfill above already hold the exclusive lock for the
+    # rest of this transaction, so SET NOT NULL's own scan happens inside
+    # that same window; a temporary check constraint would not shorten it.
+    op.execute(
+        """
+        ALTER TABLE fridge_snapshots
+            ALTER COLUMN image_bucket SET NOT NULL,
+            ALTER COLUMN image_key SET NOT NULL,
+            ALTER COLUMN image_filename SET NOT NULL
+        """
     )
-    op.drop_column("fridge_snapshots", "captured_at")
-    op.drop_column("fridge_snapshots", "source")
-    op.drop_column("fridge_snapshots", "raw_response")
 
     op.add_column(
         "snapshot_items",
@@ -23,19 +23,28 @@ def upgrade() -> None:
     op.rename_table("fridge_snapshots", "snapshots")
     op.rename_table("snapshot_items", "items")
 
-    op.drop_constraint("uq_snapshot_item_product", "items", type_="unique")
-    op.drop_column("items", "unit")
-    op.drop_column("items", "confidence")
-    op.drop_column("items", "notes")
-    op.create_unique_constraint(
-        "uq_item_product", "items", ["snapshot_id", "product_id"]
+    # Group each table's changes into a single ALTER TABLE statement.
+    op.execute(
+        """
+        ALTER TABLE items
+            DROP CONSTRAINT uq_snapshot_item_product,
+            DROP COLUMN unit,
+            DROP COLUMN confidence,
+            DROP COLUMN notes,
+            ADD CONSTRAINT uq_item_product UNIQUE (snapshot_id, product_id)
+        """
     )
 
-    op.drop_constraint("products_slug_key", "products", type_="unique")
-    op.drop_column("products", "slug")
-    op.drop_column("products", "aliases")
-    op.drop_column("products", "extra_metadata")
-    op.create_unique_constraint("uq_product_name", "products", ["name"])
+    op.execute(
+        """
+        ALTER TABLE products
+            DROP CONSTRAINT products_slug_key,
+            DROP COLUMN slug,
+            DROP COLUMN aliases,
+            DROP COLUMN extra_metadata,
+            ADD CONSTRAINT uq_product_name UNIQUE (name)
+        """
+    )
 
 
 def downgrade() -> None:
@@ -17,12 +17,42 @@ down_revision = "20241001_0005"
 branch_labels = None
 depends_on = None
 
+DEMO_USER_ID = "00000000-0000-0000-0000-000000000001"
+# Not a parseable werkzeug hash, so check_password_hash always rejects it.
+UNUSABLE_PASSWORD_HASH = "!"
 DEMO_USER_PASSWORD_HASH = (
     "scrypt:32768:8:1$9UhdfW9nDT12TkmN$"
     "5e3c5a26098d0c9e4abc97bfe0caee5d9835699b7fba7892286f8bc99"
     "c7c03db1fe4f264481811c4dea47a546b832f3363c3fb44abd383ca4b"
     "f8787c5674dc1c"
 )
+BACKFILL_BATCH_SIZE = 10_000
+
+_BACKFILL_SQL = """
+    WITH batch AS (
+        SELECT id FROM users
+        {where}
+        ORDER BY id
+        LIMIT :batch_size
+    )
+    UPDATE users
+    SET email = LOWER(users.email),
+        password_hash = COALESCE(
+            users.password_hash,
+            CASE
+                WHEN users.id = CAST(:demo_user_id AS uuid)
+                THEN :demo_password_hash
+                ELSE :unusable_password_hash
+            END
+        )
+    FROM batch
+    WHERE users.id = batch.id
+    RETURNING users.id
+"""
+_BACKFILL_FIRST_BATCH = sa.text(_BACKFILL_SQL.format(where=""))
+_BACKFILL_NEXT_BATCH = sa.text(
+    _BACKFILL_SQL.format(where="WHERE id > CAST(:last_id AS uuid)")
+)
 
 
 def upgrade() -> None:
@@ -44,32 +74,62 @@ def upgrade() -> None:
         ),
     )
 
-    op.execute(sa.text("UPDATE users SET email = LOWER(email)"))
+    # Normalize emails and backfill hashes in one pass so each row is
+    # rewritten once. Only the demo account keeps a usable password; other
+    # pre-existing users get a sentinel that can never verify. Rows are walked
+    # in id order in autocommitted batches so a large users table is never
+    # locked or rewritten in a single long transaction.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        last_id = None
+        while True:
+            batch = _BACKFILL_FIRST_BATCH if last_id is None else _BACKFILL_NEXT_BATCH
+            ids = bind.execute(
+                batch,
+                {
+                    "last_id": last_id,
+                    "batch_size": BACKFILL_BATCH_SIZE,
+                    "demo_user_id": DEMO_USER_ID,
+                    "demo_password_hash": DEMO_USER_PASSWORD_HASH,
+                    "unusable_password_hash": UNUSABLE_PASSWORD_HASH,
+                },
+            ).scalars().all()
+            if not ids:
+                break
+            last_id = max(ids)
 
-    op.execute(
-        sa.text(
-            """
-            UPDATE users
-            SET password_hash = :password_hash
-            WHERE password_hash IS NULL
-            """
-        ).bindparams(password_hash=DEMO_USER_PASSWORD_HASH)
-    )
+    # Build the replacement unique index without holding a write lock on
+    # users; CONCURRENTLY cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "uq_users_email_lower ON users (lower(email))"
+        )
 
     op.drop_constraint("users_email_key", "users", type_="unique")
-    op.create_index(
-        "uq_users_email_lower",
-        "users",
-        [sa.text("lower(email)")],
-        unique=True,
-    )
 
+    # Adding the check NOT VALID only needs a brief lock. Validating it in
+    # its own autocommitted statement scans users under SHARE UPDATE
+    # EXCLUSIVE, so writes keep flowing. SET NOT NULL then trusts the
+    # validated check and skips its own scan under the exclusive lock.
+    op.execute(
+        """
+        ALTER TABLE users
+            ADD CONSTRAINT ck_users_password_hash_nn
+                CHECK (password_hash IS NOT NULL) NOT VALID
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE users VALIDATE CONSTRAINT ck_users_password_hash_nn"
+        )
     op.alter_column(
         "users",
         "password_hash",
         existing_type=sa.String(length=255),
         nullable=False,
     )
+    op.drop_constraint("ck_users_password_hash_nn", "users", type_="check")
 
 
 def downgrade() -> None:
@@ -79,8 +139,9 @@ def downgrade() -> None:
         existing_type=sa.String(length=255),
         nullable=True,
     )
-    op.drop_index("uq_users_email_lower", table_name="users")
     op.create_unique_constraint("users_email_key", "users", ["email"])
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS uq_users_email_lower")
     op.drop_column("users", "updated_at")
     op.drop_column("users", "last_login_at")
     op.drop_column("users", "password_hash")
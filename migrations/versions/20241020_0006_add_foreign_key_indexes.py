@@ -0,0 +1,31 @@
+"""index foreign key columns on snapshots, items and jobs
+
+Revision ID: 20241020_0006
+Revises: 20240915_0004
+Create Date: 2024-10-20 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241020_0006"
+down_revision = "20240915_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_snapshots_user_id", "snapshots", ["user_id"])
+    # items.snapshot_id is already the leading column of uq_item_product, so
+    # only product_id needs its own index for joins and FK checks.
+    op.create_index("ix_items_product_id", "items", ["product_id"])
+    op.create_index("ix_jobs_snapshot_id", "jobs", ["snapshot_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_snapshot_id", table_name="jobs")
+    op.drop_index("ix_items_product_id", table_name="items")
+    op.drop_index("ix_snapshots_user_id", table_name="snapshots")
@@ -0,0 +1,26 @@
+"""index jobs for the worker polling query
+
+Revision ID: 20241022_0007
+Revises: 20241020_0006
+Create Date: 2024-10-22 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241022_0007"
+down_revision = "20241020_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Equality on status first, then the run_at range the worker scans.
+    op.create_index("ix_jobs_status_run_at", "jobs", ["status", "run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status_run_at", table_name="jobs")
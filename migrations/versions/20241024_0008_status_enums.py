@@ -0,0 +1,83 @@
+"""store snapshot and job statuses as native enums
+
+Revision ID: 20241024_0008
+Revises: 20241022_0007
+Create Date: 2024-10-24 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20241024_0008"
+down_revision = "20241022_0007"
+branch_labels = None
+depends_on = None
+
+SNAPSHOT_STATUSES = ("pending", "processing", "complete", "failed")
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+
+def _status_in(values: tuple[str, ...]) -> str:
+    return "status in ({})".format(",".join(f"'{value}'" for value in values))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    postgresql.ENUM(*SNAPSHOT_STATUSES, name="snapshot_status").create(bind)
+    postgresql.ENUM(*JOB_STATUSES, name="job_status").create(bind)
+
+    # The enum types enforce the allowed values, so the checks are redundant.
+    op.drop_constraint("ck_snapshots_status", "snapshots", type_="check")
+    op.drop_constraint("ck_jobs_status", "jobs", type_="check")
+
+    op.execute(
+        """
+        ALTER TABLE snapshots
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE snapshot_status
+                USING status::snapshot_status,
+            ALTER COLUMN status SET DEFAULT 'pending'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE jobs
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE job_status USING status::job_status,
+            ALTER COLUMN status SET DEFAULT 'queued'
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        ALTER TABLE jobs
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE VARCHAR(32) USING status::text,
+            ALTER COLUMN status SET DEFAULT 'queued'
+        """
+    )
+    op.execute(
+        """
+        ALTER TABLE snapshots
+            ALTER COLUMN status DROP DEFAULT,
+            ALTER COLUMN status TYPE VARCHAR(32) USING status::text,
+            ALTER COLUMN status SET DEFAULT 'pending'
+        """
+    )
+
+    op.create_check_constraint(
+        "ck_jobs_status", "jobs", _status_in(JOB_STATUSES)
+    )
+    op.create_check_constraint(
+        "ck_snapshots_status", "snapshots", _status_in(SNAPSHOT_STATUSES)
+    )
+
+    bind = op.get_bind()
+    postgresql.ENUM(name="job_status").drop(bind)
+    postgresql.ENUM(name="snapshot_status").drop(bind)
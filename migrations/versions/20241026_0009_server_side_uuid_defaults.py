@@ -0,0 +1,36 @@
+"""generate primary key UUIDs server-side
+
+Revision ID: 20241026_0009
+Revises: 20241024_0008
+Create Date: 2024-10-26 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241026_0009"
+down_revision = "20241024_0008"
+branch_labels = None
+depends_on = None
+
+TABLES = ("jobs", "snapshots", "users", "products", "items")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PG13; older servers need pgcrypto.
+    server_version = op.get_bind().dialect.server_version_info or (0,)
+    if server_version < (13,):
+        op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto")
+    for table in TABLES:
+        op.alter_column(
+            table, "id", server_default=sa.text("gen_random_uuid()")
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(TABLES):
+        op.alter_column(table, "id", server_default=None)
@@ -0,0 +1,46 @@
+"""cover items.quantity in the snapshot/product unique index
+
+Revision ID: 20241030_0011
+Revises: 20241028_0010
+Create Date: 2024-10-30 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241030_0011"
+down_revision = "20241028_0010"
+branch_labels = None
+depends_on = None
+
+CONSTRAINT_NAME = "uq_item_product"
+REPLACEMENT_INDEX = "uq_item_product_new"
+
+
+def _swap_unique_index(include: str) -> None:
+    # Build the replacement without blocking writes, then swap it in; the
+    # constraint is only missing for the duration of the final ALTER.
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {REPLACEMENT_INDEX}")
+        op.execute(
+            f"CREATE UNIQUE INDEX CONCURRENTLY {REPLACEMENT_INDEX} "
+            f"ON items (snapshot_id, product_id){include}"
+        )
+    op.execute(
+        f"""
+        ALTER TABLE items
+            DROP CONSTRAINT {CONSTRAINT_NAME},
+            ADD CONSTRAINT {CONSTRAINT_NAME} UNIQUE USING INDEX {REPLACEMENT_INDEX}
+        """
+    )
+
+
+def upgrade() -> None:
+    _swap_unique_index(" INCLUDE (quantity)")
+
+
+def downgrade() -> None:
+    _swap_unique_index("")
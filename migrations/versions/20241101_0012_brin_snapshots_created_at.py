@@ -0,0 +1,33 @@
+"""add a BRIN index on snapshots.created_at
+
+Revision ID: 20241101_0012
+Revises: 20241030_0011
+Create Date: 2024-11-01 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241101_0012"
+down_revision = "20241030_0011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Snapshots are append-only, so created_at tracks physical order and a
+    # BRIN summary serves time-range scans at a fraction of a B-tree's size.
+    op.create_index(
+        "ix_snapshots_created_at_brin",
+        "snapshots",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_snapshots_created_at_brin", table_name="snapshots")
@@ -0,0 +1,54 @@
+"""index snapshots by (user_id, created_at, id) for keyset pagination
+
+Revision ID: 20241103_0013
+Revises: 20241101_0012
+Create Date: 2024-11-03 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241103_0013"
+down_revision = "20241101_0012"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the per-user newest-first listing and its (created_at, id)
+    # cursor seek with a backward index scan; user_id stays the leading
+    # column, so the single-column FK index becomes redundant.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_snapshots_user_created_at",
+            "snapshots",
+            ["user_id", "created_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_snapshots_user_id",
+            table_name="snapshots",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_snapshots_user_id",
+            "snapshots",
+            ["user_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_snapshots_user_created_at",
+            table_name="snapshots",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
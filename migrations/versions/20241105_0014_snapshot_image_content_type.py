@@ -0,0 +1,31 @@
+"""record the uploaded image content type on snapshots
+
+Revision ID: 20241105_0014
+Revises: 20241103_0013
+Create Date: 2024-11-05 00:00:00.000000
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20241105_0014"
+down_revision = "20241103_0013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Nullable with no default, so this is a catalog-only change; existing
+    # rows keep falling back to guessing from image_filename.
+    op.add_column(
+        "snapshots",
+        sa.Column("image_content_type", sa.String(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("snapshots", "image_content_type")
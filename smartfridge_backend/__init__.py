@@ -1,16 +1,15 @@
+import hashlib
 import logging
-import os
+import sys
 from pathlib import Path
 
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, Response, jsonify, request, send_from_directory
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from smartfridge_backend.api import init_app as init_api
-from smartfridge_backend.config import (
-    DEFAULT_LLM_MODEL,
-    DEFAULT_LLM_SYSTEM_PROMPT,
-)
+from smartfridge_backend.config import AppConfig
+from smartfridge_backend.json_provider import OrjsonProvider
 from smartfridge_backend.models import get_database_url
 from smartfridge_backend.services.llm import (
     TextLLMSettings,
@@ -18,7 +17,10 @@ from smartfridge_backend.services.llm import (
     init_text_llm_client,
     init_vision_llm_client,
 )
-from smartfridge_backend.services.worker import SnapshotJobWorker, WorkerSettings
+from smartfridge_backend.services.recipes import (
+    init_spoonacular_session,
+    prewarm_spoonacular_session,
+)
 from smartfridge_backend.services.storage import (
     SnapshotStorageSettings,
     init_snapshot_storage,
@@ -27,32 +29,37 @@ from smartfridge_backend.services.storage import (
 FRONTEND_DIST_DIR = (
     Path(__file__).resolve().parent.parent / "smartfridge_frontend" / "dist"
 )
+FRONTEND_ASSET_MAX_AGE = 31536000  # one year, in seconds
 
 
 def create_app() -> Flask:
     """Application factory for the SmartFridge backend."""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    config = AppConfig.from_env()
+    app.extensions["app_config"] = config
 
-    auth_secret = os.environ.get("SMARTFRIDGE_AUTH_SECRET")
-    if auth_secret:
-        app.config["AUTH_SECRET"] = auth_secret
+    # Reject oversized uploads before their bodies are read; 0 disables it.
+    app.config["MAX_CONTENT_LENGTH"] = config.max_upload_bytes or None
+
+    if config.auth_secret:
+        app.config["AUTH_SECRET"] = config.auth_secret
     else:
         app.logger.warning(
             "SMARTFRIDGE_AUTH_SECRET not set; authentication endpoints will be disabled"
         )
 
     _configure_logging(app)
-    _init_database(app)
+    _init_database(app, config)
 
-    storage_bucket = os.environ.get("SMARTFRIDGE_S3_BUCKET")
-    if storage_bucket:
+    if config.storage_bucket:
         storage_settings = SnapshotStorageSettings(
-            bucket=storage_bucket,
-            region_name=os.environ.get("SMARTFRIDGE_S3_REGION"),
-            endpoint_url=os.environ.get("SMARTFRIDGE_S3_ENDPOINT_URL"),
-            base_prefix=os.environ.get("SMARTFRIDGE_S3_BASE_PREFIX", "snapshots"),
-            access_key_id=os.environ.get("AWS_ACCESS_KEY_ID"),
-            secret_access_key=os.environ.get("AWS_SECRET_ACCESS_KEY"),
+            bucket=config.storage_bucket,
+            region_name=config.storage_region,
+            endpoint_url=config.storage_endpoint_url,
+            base_prefix=config.storage_base_prefix,
+            access_key_id=config.aws_access_key_id,
+            secret_access_key=config.aws_secret_access_key,
         )
         app.extensions["snapshot_storage"] = init_snapshot_storage(
             storage_settings
@@ -70,26 +77,22 @@ def create_app() -> Flask:
     def api_healthcheck():
         return jsonify(status="ok")
 
-    llm_api_key = os.environ.get("SMARTFRIDGE_LLM_API_KEY") or os.environ.get(
-        "OPENAI_API_KEY"
-    )
-    llm_model = os.environ.get("SMARTFRIDGE_LLM_MODEL", DEFAULT_LLM_MODEL)
-    llm_system_prompt = os.environ.get(
-        "SMARTFRIDGE_LLM_SYSTEM_PROMPT", DEFAULT_LLM_SYSTEM_PROMPT
-    )
+    app.extensions["spoonacular_session"] = init_spoonacular_session()
+    if config.spoonacular_api_key:
+        prewarm_spoonacular_session(app.extensions["spoonacular_session"])
 
-    if llm_api_key:
+    if config.llm_api_key:
         app.extensions["text_llm_client"] = init_text_llm_client(
             TextLLMSettings(
-                api_key=llm_api_key,
-                model=llm_model,
+                api_key=config.llm_api_key,
+                model=config.llm_model,
             )
         )
         app.extensions["vision_llm_client"] = init_vision_llm_client(
             VisionLLMSettings(
-                api_key=llm_api_key,
-                model=llm_model,
-                system_prompt=llm_system_prompt or None,
+                api_key=config.llm_api_key,
+                model=config.llm_model,
+                system_prompt=config.llm_system_prompt or None,
             )
         )
     else:
@@ -98,7 +101,7 @@ def create_app() -> Flask:
         )
 
     init_api(app)
-    _maybe_start_worker(app)
+    _maybe_start_worker(app, config)
     _register_frontend(app)
 
     return app
@@ -112,7 +115,7 @@ def _configure_logging(app: Flask) -> None:
     app.logger.setLevel(logging.INFO)
 
 
-def _init_database(app: Flask) -> None:
+def _init_database(app: Flask, config: AppConfig) -> None:
     """Configure the SQLAlchemy session factory for request handlers."""
 
     try:
@@ -123,7 +126,25 @@ def _init_database(app: Flask) -> None:
         )
         return
 
-    engine = create_engine(database_url, pool_pre_ping=True)
+    # pool_recycle retires connections before the server drops idle ones and
+    # TCP keepalives surface dead sockets in the background, so checkouts skip
+    # the pre-ping round-trip. JIT only adds planning overhead for the short
+    # OLTP queries this app runs.
+    engine = create_engine(
+        database_url,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_recycle=config.db_pool_recycle,
+        pool_pre_ping=False,
+        connect_args={
+            "application_name": "smartfridge",
+            "options": "-c jit=off",
+            "keepalives": 1,
+            "keepalives_idle": 30,
+            "keepalives_interval": 10,
+            "keepalives_count": 3,
+        },
+    )
     SessionLocal = sessionmaker(
         bind=engine,
         autoflush=False,
@@ -133,10 +154,16 @@ def _init_database(app: Flask) -> None:
     app.extensions["db_sessionmaker"] = SessionLocal
 
 
-def _maybe_start_worker(app: Flask) -> None:
+def _maybe_start_worker(app: Flask, config: AppConfig) -> None:
     """Start the background snapshot worker when dependencies are available."""
 
-    concurrency_env = os.environ.get("WORKER_CONCURRENCY", "1")
+    if config.worker_disabled or "alembic" in Path(sys.argv[0]).name:
+        app.logger.info("snapshot worker disabled for this process")
+        return
+
+    from smartfridge_backend.services.worker import SnapshotJobWorker, WorkerSettings
+
+    concurrency_env = config.worker_concurrency
     try:
         concurrency = int(concurrency_env)
     except ValueError:
@@ -190,18 +217,34 @@ def _register_frontend(app: Flask) -> None:
         )
         return
 
+    # The SPA shell never changes after a build, so keep it in memory and let
+    # browsers revalidate it cheaply with the ETag.
+    index_bytes = (FRONTEND_DIST_DIR / "index.html").read_bytes()
+    index_etag = hashlib.md5(index_bytes, usedforsecurity=False).hexdigest()
+    # The bundle is immutable once built, so index its files up front instead
+    # of stat-ing the filesystem on every request.
+    asset_paths = frozenset(
+        asset.relative_to(FRONTEND_DIST_DIR).as_posix()
+        for asset in FRONTEND_DIST_DIR.rglob("*")
+        if asset.is_file()
+    )
+
     @app.route("/", defaults={"path": ""})
     @app.route("/<path:path>")
     def _serve_frontend(path: str):
-        asset_path = FRONTEND_DIST_DIR / path
-        if path and asset_path.exists():
-            return send_from_directory(FRONTEND_DIST_DIR, path)
-
-        return send_from_directory(FRONTEND_DIST_DIR, "index.html")
-
+        if path in asset_paths:
+            # Vite fingerprints everything under assets/, so it can be cached
+            # for as long as browsers allow.
+            max_age = (
+                FRONTEND_ASSET_MAX_AGE if path.startswith("assets/") else None
+            )
+            return send_from_directory(FRONTEND_DIST_DIR, path, max_age=max_age)
 
-app = create_app()
+        response = Response(index_bytes, mimetype="text/html")
+        response.set_etag(index_etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response.make_conditional(request)
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000)
+    create_app().run(host="0.0.0.0", port=8000)
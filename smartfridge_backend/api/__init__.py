@@ -2,7 +2,7 @@
 
 from flask import Flask
 
-from .auth import attach_user_from_access_cookie, bp as auth_bp
+from .auth import attach_user_from_access_cookie, bp as auth_bp, init_auth_context
 from .recipes import bp as recipes_bp
 from .statistics import bp as statistics_bp
 from .snapshot import bp as snapshot_bp
@@ -11,6 +11,7 @@ from .snapshot import bp as snapshot_bp
 def init_app(app: Flask) -> None:
     """Register all API blueprints on the given application."""
 
+    init_auth_context(app)
     app.before_request(attach_user_from_access_cookie)
 
     app.register_blueprint(auth_bp)
@@ -2,27 +2,46 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+import hashlib
+import re
+import time
 import uuid
 
 import jwt
-from flask import Blueprint, current_app, g, jsonify, request
+from flask import Blueprint, Flask, current_app, g, jsonify, request
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, sessionmaker
 from werkzeug.security import check_password_hash, generate_password_hash
 
-from smartfridge_backend.api.deps import get_sessionmaker
 from smartfridge_backend.models import User
 from smartfridge_backend.services.auth_tokens import (
     AuthSettings,
     apply_auth_cookies,
     clear_auth_cookies,
     decode_token,
+    get_auth_settings,
     issue_token_pair,
 )
+from smartfridge_backend.services.cache import TTLCache
 
 _SKIP_PATH_PREFIXES = ("/api/auth",)
 _SKIP_PATHS = {"/healthz", "/api/healthz"}
+# One anchored pattern so the per-request check is a single C-level match.
+_SKIP_PATH_RE = re.compile(
+    "(?:{prefixes})(?:/|$)|(?:{paths})$".format(
+        prefixes="|".join(re.escape(prefix) for prefix in _SKIP_PATH_PREFIXES),
+        paths="|".join(re.escape(path) for path in sorted(_SKIP_PATHS)),
+    )
+)
+# Remember rejected (email, password) pairs for a moment so a burst of
+# identical retries is refused without re-running the password KDF.
+FAILED_LOGIN_TTL_SECONDS = 1.0
+_failed_logins: TTLCache[bool] = TTLCache(maxsize=10_000)
 bp = Blueprint("auth", __name__, url_prefix="/api/auth")
 
 
@@ -37,6 +56,18 @@ def attach_user_from_access_cookie():
     if auth_ctx.error_response:
         return auth_ctx.error_response
 
+    if auth_ctx.settings.trust_access_claims:
+        # A verified, short-lived access token is enough to identify the
+        # caller; handlers that need the full row load it themselves.
+        payload, error = _decode_access_cookie(auth_ctx, require_cookie=True)
+        if error:
+            return error
+        user_id, error = _user_id_from_payload(payload)
+        if error:
+            return error
+        g.user_id = user_id
+        return None
+
     user, error = _load_user_from_access_cookie(auth_ctx, require_cookie=True)
     if error:
         return error
@@ -47,11 +78,7 @@ def attach_user_from_access_cookie():
 
 
 def _should_enforce_auth(path: str) -> bool:
-    if not path.startswith("/api"):
-        return False
-    if path in _SKIP_PATHS:
-        return False
-    return not any(path.startswith(prefix) for prefix in _SKIP_PATH_PREFIXES)
+    return path.startswith("/api") and _SKIP_PATH_RE.match(path) is None
 
 
 @bp.post("/signup")
@@ -76,20 +103,22 @@ def signup():
 
     try:
         with auth_ctx.session_factory() as session:
-            existing = session.scalar(
-                select(User).where(func.lower(User.email) == email)
+            # One round-trip: the unique lower(email) index arbitrates
+            # duplicates and RETURNING hands back the server-filled columns.
+            user = session.scalar(
+                pg_insert(User)
+                .values(email=email, password_hash=password_hash, name=name)
+                .on_conflict_do_nothing(index_elements=[func.lower(User.email)])
+                .returning(User)
             )
-            if existing:
+            if user is None:
                 return jsonify(error="user already exists"), 409
-
-            user = User(email=email, password_hash=password_hash, name=name)
-            session.add(user)
             session.commit()
-            session.refresh(user)
     except SQLAlchemyError:
         current_app.logger.exception("failed to create user")
         return jsonify(error="database failure while creating user"), 500
 
+    _failed_logins.discard(_login_attempt_key(email, password))
     tokens = issue_token_pair(user.id, settings=auth_ctx.settings)
     response = jsonify(user=_serialize_user(user))
     apply_auth_cookies(response, tokens, settings=auth_ctx.settings)
@@ -111,16 +140,21 @@ def login():
     if auth_ctx.error_response:
         return auth_ctx.error_response
 
+    attempt_key = _login_attempt_key(email, password)
+    if _failed_logins.get(attempt_key):
+        return jsonify(error="invalid credentials"), 401
+
     now = datetime.now(timezone.utc)
 
     try:
         with auth_ctx.session_factory() as session:
-            user = session.scalar(
-                select(User).where(func.lower(User.email) == email)
-            )
+            user = _find_user_by_email(session, email)
             if not user or not check_password_hash(
                 user.password_hash, password
             ):
+                _failed_logins.set(
+                    attempt_key, True, time.time() + FAILED_LOGIN_TTL_SECONDS
+                )
                 return jsonify(error="invalid credentials"), 401
 
             user.last_login_at = now
@@ -188,35 +222,72 @@ def _normalize_email(value) -> str | None:
     return value or None
 
 
+def _login_attempt_key(email: str, password) -> bytes:
+    # Digest rather than the raw pair so plaintext passwords are not retained.
+    return hashlib.sha256(f"{email}\0{password}".encode()).digest()
+
+
+def _find_user_by_email(session: Session, email: str) -> User | None:
+    # Match the lower(email) expression of uq_users_email_lower so the lookup
+    # is a unique-index probe; a bare User.email comparison has no index.
+    return session.scalar(select(User).where(func.lower(User.email) == email))
+
+
+@dataclass(frozen=True, slots=True)
 class _AuthContext:
-    def __init__(
-        self,
-        settings: AuthSettings | None,
-        session_factory,
-        error_response,
-    ):
-        self.settings = settings
-        self.session_factory = session_factory
-        self.error_response = error_response
+    settings: AuthSettings | None
+    session_factory: sessionmaker | None
+    error: str | None = None
 
+    @property
+    def error_response(self):
+        if self.error is None:
+            return None
+        return jsonify(error=self.error), 503
 
-def _get_auth_context() -> _AuthContext:
-    try:
-        settings = AuthSettings.load()
-    except RuntimeError as exc:
-        return _AuthContext(None, None, (jsonify(error=str(exc)), 503))
 
+def init_auth_context(app: Flask) -> None:
+    """Resolve auth settings and the session factory once for ``app``."""
+
+    app.extensions["auth_context"] = _build_auth_context(app)
+
+
+def _build_auth_context(app: Flask) -> _AuthContext:
     try:
-        session_factory = get_sessionmaker()
+        settings = get_auth_settings(app)
     except RuntimeError as exc:
-        return _AuthContext(settings, None, (jsonify(error=str(exc)), 503))
+        return _AuthContext(None, None, str(exc))
+
+    session_factory = app.extensions.get("db_sessionmaker")
+    if session_factory is None:
+        return _AuthContext(
+            settings, None, "database session factory is not configured"
+        )
 
-    return _AuthContext(settings, session_factory, None)
+    return _AuthContext(settings, session_factory)
+
+
+def _get_auth_context() -> _AuthContext:
+    auth_ctx = current_app.extensions.get("auth_context")
+    if auth_ctx is None:
+        # Apps that skipped init_app still work, just without the memo.
+        auth_ctx = _build_auth_context(current_app)
+    return auth_ctx
 
 
 def _load_user_from_access_cookie(
     auth_ctx: _AuthContext, require_cookie: bool
 ) -> tuple[User | None, tuple | None]:
+    payload, error = _decode_access_cookie(auth_ctx, require_cookie)
+    if payload is None:
+        return None, error
+
+    return _load_user_from_payload(auth_ctx, payload)
+
+
+def _decode_access_cookie(
+    auth_ctx: _AuthContext, require_cookie: bool
+) -> tuple[dict | None, tuple | None]:
     access_token = request.cookies.get(auth_ctx.settings.access_cookie_name)
     if not access_token:
         if require_cookie:
@@ -235,7 +306,7 @@ def _load_user_from_access_cookie(
         current_app.logger.warning("invalid access token: %s", exc)
         return None, (jsonify(error="unauthorized"), 401)
 
-    return _load_user_from_payload(auth_ctx, payload)
+    return payload, None
 
 
 def _load_user_from_refresh_cookie(
@@ -263,11 +334,9 @@ def _load_user_from_refresh_cookie(
 def _load_user_from_payload(
     auth_ctx: _AuthContext, payload: dict[str, str]
 ) -> tuple[User | None, tuple | None]:
-    user_id = payload.get("sub")
-    try:
-        user_uuid = uuid.UUID(str(user_id))
-    except (TypeError, ValueError):
-        return None, (jsonify(error="unauthorized"), 401)
+    user_uuid, error = _user_id_from_payload(payload)
+    if error:
+        return None, error
 
     try:
         with auth_ctx.session_factory() as session:
@@ -282,6 +351,22 @@ def _load_user_from_payload(
     return user, None
 
 
+def _user_id_from_payload(
+    payload: dict[str, str],
+) -> tuple[uuid.UUID | None, tuple | None]:
+    try:
+        return _parse_user_id(str(payload.get("sub"))), None
+    except (TypeError, ValueError):
+        return None, (jsonify(error="unauthorized"), 401)
+
+
+@lru_cache(maxsize=4096)
+def _parse_user_id(sub: str) -> uuid.UUID:
+    # The same handful of subjects arrive on every request; parse each once.
+    # Invalid values raise and are not cached.
+    return uuid.UUID(sub)
+
+
 def _serialize_user(user: User) -> dict[str, str | None]:
     last_login = (
         user.last_login_at.isoformat() if user.last_login_at else None
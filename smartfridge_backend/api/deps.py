@@ -1,7 +1,10 @@
 """Shared API dependencies and helpers."""
 
-from flask import current_app
+from flask import current_app, g
 from sqlalchemy.orm import Session, sessionmaker
+from werkzeug.local import LocalProxy
+
+from smartfridge_backend.models import User
 
 
 def get_sessionmaker() -> sessionmaker:
@@ -19,3 +22,38 @@ def get_db_session() -> Session:
     """Return a database session scoped to the current request context."""
 
     return get_sessionmaker()()
+
+
+def load_current_user(session: Session) -> User | None:
+    """Return the authenticated user, loading it on ``session`` if needed.
+
+    Handlers that already hold a request session use this instead of
+    ``current_user`` so the lookup shares their connection checkout.
+    """
+
+    if "user" in g:
+        return g.user
+
+    user_id = g.get("user_id")
+    user = session.get(User, user_id) if user_id is not None else None
+    g.user = user
+    return user
+
+
+def _resolve_current_user() -> User | None:
+    """Load the authenticated user on first use and memoize it on ``g``."""
+
+    if "user" in g:
+        return g.user
+    if g.get("user_id") is None:
+        g.user = None
+        return None
+
+    with get_db_session() as session:
+        return load_current_user(session)
+
+
+# The auth hook only records ``g.user_id``; the row is fetched the first time
+# a handler actually touches ``current_user``. Falsy when nobody is signed in
+# or the account no longer exists.
+current_user: User = LocalProxy(_resolve_current_user)  # type: ignore[assignment]
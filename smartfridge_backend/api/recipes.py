@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import os
-from typing import Any, Mapping, Sequence
+from typing import Any, Mapping
 
 from flask import Blueprint, current_app, g, jsonify
 import requests
 from sqlalchemy.exc import SQLAlchemyError
 
 from smartfridge_backend.api.deps import get_sessionmaker
-from smartfridge_backend.services.inventory import (
-    InventoryItem,
-    fetch_latest_items_for_user,
+from smartfridge_backend.services.inventory import fetch_latest_items_for_user
+from smartfridge_backend.services.recipes import (
+    cache_recipes,
+    get_cached_recipes,
+    get_recipe_validator,
+    prepare_spoonacular_query,
 )
 
 bp = Blueprint("recipes", __name__, url_prefix="/api")
@@ -21,10 +23,7 @@ SPOONACULAR_FIND_BY_INGREDIENTS_URL = (
     "https://api.spoonacular.com/recipes/findByIngredients"
 )
 SPOONACULAR_API_KEY_ENV = "SPOONACULAR_API_KEY"
-_DEFAULT_RECIPE_LIMIT = 6
 _SPOONACULAR_TIMEOUT_SECONDS = 10
-_ParamValue = str | bytes | int | float | bool | Sequence[str | bytes | int | float | bool]
-_RequestParams = Mapping[str, _ParamValue]
 
 
 def _summarize_recipe(recipe: Mapping[str, Any]) -> dict[str, Any]:
@@ -74,37 +73,18 @@ def _summarize_recipe(recipe: Mapping[str, Any]) -> dict[str, Any]:
     }
 
 
-def _prepare_spoonacular_query(
-    items: list[InventoryItem]
-) -> _RequestParams:
-    """Shape fridge items into the query params Spoonacular expects."""
-
-    ingredient_tokens: list[str] = []
-    for entry in items:
-        name = entry["name"].strip()
-        if not name:
-            continue
-        count = entry["quantity"]
-        ingredient_tokens.extend([name] * max(count, 1))
-
-    # Deduplicate while preserving order to keep the query readable.
-    seen: set[str] = set()
-    unique_ingredients = []
-    for ingredient in ingredient_tokens:
-        if ingredient not in seen:
-            unique_ingredients.append(ingredient)
-            seen.add(ingredient)
-
-    return {
-        "ingredients": ",".join(unique_ingredients),
-        "number": _DEFAULT_RECIPE_LIMIT,
-        "ranking": 2,
-        "ignorePantry": True,
-    }
+def _get_spoonacular_session() -> requests.Session:
+    session: requests.Session | None = current_app.extensions.get(
+        "spoonacular_session"
+    )
+    if session is None:
+        raise RuntimeError("Spoonacular HTTP session is not configured")
+    return session
 
 
 def _get_spoonacular_api_key() -> str:
-    api_key = os.environ.get(SPOONACULAR_API_KEY_ENV)
+    config = current_app.extensions.get("app_config")
+    api_key = config.spoonacular_api_key if config else None
     if not api_key:
         raise RuntimeError(f"{SPOONACULAR_API_KEY_ENV} is not configured")
     return api_key
@@ -138,37 +118,50 @@ def prepare_recipes_query():
             404,
         )
 
-    try:
-        api_key = _get_spoonacular_api_key()
-    except RuntimeError as exc:
-        return jsonify(error=str(exc)), 503
-
-    spoonacular_query = _prepare_spoonacular_query(items)
-    try:
-        api_response = requests.get(
-            SPOONACULAR_FIND_BY_INGREDIENTS_URL,
-            params={**spoonacular_query, "apiKey": api_key},
-            timeout=_SPOONACULAR_TIMEOUT_SECONDS,
-        )
-    except requests.RequestException:
-        current_app.logger.exception("failed to call Spoonacular API")
-        return jsonify(error="failed to reach Spoonacular API"), 502
-
-    if not api_response.ok:
-        current_app.logger.warning(
-            "Spoonacular API returned %s: %s",
-            api_response.status_code,
-            api_response.text[:512],
-        )
-        return jsonify(error="Spoonacular API request failed"), 502
-
-    try:
-        recipes = api_response.json()
-    except ValueError:
-        current_app.logger.exception("invalid Spoonacular API response")
-        return jsonify(error="invalid Spoonacular API response"), 502
-
-    # current_app.logger.info("Spoonacular recipes payload: %r", recipes)
+    spoonacular_query = prepare_spoonacular_query(items)
+    recipes = get_cached_recipes(spoonacular_query)
+    if recipes is None:
+        try:
+            api_key = _get_spoonacular_api_key()
+            http = _get_spoonacular_session()
+        except RuntimeError as exc:
+            return jsonify(error=str(exc)), 503
+
+        validator = get_recipe_validator(spoonacular_query)
+        try:
+            api_response = http.get(
+                SPOONACULAR_FIND_BY_INGREDIENTS_URL,
+                params={**spoonacular_query, "apiKey": api_key},
+                headers={"If-None-Match": validator[0]} if validator else None,
+                timeout=_SPOONACULAR_TIMEOUT_SECONDS,
+            )
+        except requests.RequestException:
+            current_app.logger.exception("failed to call Spoonacular API")
+            return jsonify(error="failed to reach Spoonacular API"), 502
+
+        if api_response.status_code == 304 and validator:
+            etag, recipes = validator
+            cache_recipes(spoonacular_query, recipes, etag=etag)
+        elif not api_response.ok:
+            current_app.logger.warning(
+                "Spoonacular API returned %s: %s",
+                api_response.status_code,
+                api_response.text[:512],
+            )
+            return jsonify(error="Spoonacular API request failed"), 502
+        else:
+            try:
+                payload = api_response.json()
+            except ValueError:
+                current_app.logger.exception("invalid Spoonacular API response")
+                return jsonify(error="invalid Spoonacular API response"), 502
+
+            recipes = [_summarize_recipe(recipe) for recipe in payload]
+            cache_recipes(
+                spoonacular_query,
+                recipes,
+                etag=api_response.headers.get("ETag"),
+            )
 
     return jsonify(
         items=items,
@@ -176,5 +169,5 @@ def prepare_recipes_query():
             "endpoint": SPOONACULAR_FIND_BY_INGREDIENTS_URL,
             "query_params": spoonacular_query,
         },
-        recipes=[_summarize_recipe(recipe) for recipe in recipes]
+        recipes=recipes,
     )
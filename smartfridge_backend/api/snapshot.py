@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from io import BytesIO
-import mimetypes
+import base64
+import binascii
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 import uuid
 
 from flask import (
@@ -12,25 +15,36 @@ from flask import (
     g,
     jsonify,
     request,
-    send_file,
     url_for,
 )
-from sqlalchemy import select
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
-from smartfridge_backend.api.deps import get_db_session
+from smartfridge_backend.api.deps import get_db_session, load_current_user
+from smartfridge_backend.config.app import DEFAULT_MAX_UPLOAD_BYTES
 from smartfridge_backend.models import (
     FridgeSnapshot,
+    Product,
     ProductCategory,
     SnapshotItem,
 )
-from smartfridge_backend.services.ingestion import create_snapshot_request
+from smartfridge_backend.services.ingestion import (
+    create_snapshot_request,
+    snapshot_image_content_type,
+)
 from smartfridge_backend.services.storage import (
     S3SnapshotStorage,
     SnapshotStorageError,
 )
-from smartfridge_backend.services.uploads import save_image_upload
+from smartfridge_backend.services.uploads import (
+    ALLOWED_IMAGE_CONTENT_TYPES,
+    StoredImage,
+    confirm_presigned_upload,
+    presign_image_upload,
+    save_image_stream,
+    save_image_upload,
+)
 
 bp = Blueprint("snapshot", __name__, url_prefix="/api")
 
@@ -44,47 +58,95 @@ def _get_snapshot_storage() -> S3SnapshotStorage:
     return storage
 
 
-def _serialize_snapshot(snapshot: FridgeSnapshot) -> dict[str, object]:
+_CATEGORY_LABELS = ProductCategory.key_value_map()
+_snapshot_fields = attrgetter("id", "created_at", "items")
+_item_fields = attrgetter("product", "quantity")
+_product_fields = attrgetter("name", "category")
+
+
+@lru_cache(maxsize=256)
+def _category_fields(raw_category: str | None) -> tuple[str | None, str | None]:
+    """Return the normalized category key and its display label."""
+
+    normalized_category = (raw_category or "").strip().upper() or None
+    return normalized_category, _CATEGORY_LABELS.get(normalized_category)
+
+
+_IMAGE_URL_PLACEHOLDER = str(uuid.UUID(int=0))
+
+
+def _image_url_template() -> str:
+    """Build the external image URL once per request; rows fill in their id."""
+
+    return url_for(
+        "snapshot.get_snapshot_image",
+        snapshot_id=_IMAGE_URL_PLACEHOLDER,
+        _external=True,
+    ).replace(_IMAGE_URL_PLACEHOLDER, "{snapshot_id}")
+
+
+def _serialize_snapshot(
+    snapshot: FridgeSnapshot, image_url_template: str
+) -> dict[str, object]:
+    snapshot_id, created_at, items = _snapshot_fields(snapshot)
     contents = []
-    for item in snapshot.items:
-        product = item.product
-        if product is None or not product.name:
+    for item in items:
+        product, quantity = _item_fields(item)
+        if product is None:
             continue
-        raw_category = (product.category or "").strip()
-        normalized_category = raw_category.upper() if raw_category else None
+        name, raw_category = _product_fields(product)
+        if not name:
+            continue
+        category, category_label = _category_fields(raw_category)
         contents.append(
             {
-                "name": product.name,
-                "quantity": max(int(item.quantity), 1),
-                "category": normalized_category,
-                "categoryLabel": (
-                    ProductCategory.key_value_map().get(normalized_category)
-                    if normalized_category
-                    else None
-                ),
+                "name": name,
+                "quantity": max(int(quantity), 1),
+                "category": category,
+                "categoryLabel": category_label,
             }
         )
 
     return {
-        "id": str(snapshot.id),
-        "timestamp": snapshot.created_at.isoformat(),
-        "imageUrl": url_for(
-            "snapshot.get_snapshot_image",
-            snapshot_id=str(snapshot.id),
-            _external=True,
-        ),
+        # orjson renders UUIDs and aware datetimes natively, byte-for-byte the
+        # same as str()/isoformat().
+        "id": snapshot_id,
+        "timestamp": created_at,
+        "imageUrl": image_url_template.format(snapshot_id=snapshot_id),
         "contents": contents,
     }
 
 
-@bp.post("/snapshot")
-def create_snapshot():
-    """Accept a snapshot upload and store it in object storage."""
+def _is_raw_image_upload() -> bool:
+    mimetype = request.mimetype
+    return mimetype == "application/octet-stream" or mimetype.startswith("image/")
+
+
+def _unsupported_raw_image_type():
+    allowed = ", ".join(sorted(ALLOWED_IMAGE_CONTENT_TYPES))
+    return jsonify(error=f"unsupported image type; send one of {allowed}"), 415
 
-    if "image" not in request.files:
-        return jsonify(error="missing file part 'image'"), 400
 
-    image_file = request.files["image"]
+@bp.post("/snapshot")
+def create_snapshot():
+    """Accept a snapshot upload and store it in object storage.
+
+    Devices can POST the raw image with an ``image/jpeg``, ``image/png``,
+    ``image/webp`` or ``image/gif`` content type and the body is streamed to
+    S3 as it arrives. Browsers keep using a multipart form with an ``image``
+    part.
+    """
+
+    raw_upload = _is_raw_image_upload()
+    # The raw body's declared type is all we know about it, so it has to be
+    # one the vision model and the image endpoint can use.
+    if raw_upload and request.mimetype not in ALLOWED_IMAGE_CONTENT_TYPES:
+        return _unsupported_raw_image_type()
+    image_file = None
+    if not raw_upload:
+        if "image" not in request.files:
+            return jsonify(error="missing file part 'image'"), 400
+        image_file = request.files["image"]
 
     try:
         storage = _get_snapshot_storage()
@@ -96,16 +158,25 @@ def create_snapshot():
     except RuntimeError as exc:
         return jsonify(error=str(exc)), 503
 
-    user = getattr(g, "user", None)
-    if user is None:
-        return jsonify(error="unauthorized"), 401
-
     try:
-        stored_image, _ = save_image_upload(
-            image_file,
-            storage,
-            user_id=str(user.id),
-        )
+        user = load_current_user(session)
+        if user is None:
+            return jsonify(error="unauthorized"), 401
+
+        if image_file is None:
+            stored_image = save_image_stream(
+                request.stream,
+                storage,
+                user_id=str(user.id),
+                content_type=request.mimetype,
+                content_length=request.content_length,
+            )
+        else:
+            stored_image = save_image_upload(
+                image_file,
+                storage,
+                user_id=str(user.id),
+            )
         snapshot = create_snapshot_request(
             session=session,
             user=user,
@@ -126,6 +197,10 @@ def create_snapshot():
     finally:
         session.close()
 
+    return _snapshot_accepted(snapshot, stored_image)
+
+
+def _snapshot_accepted(snapshot: FridgeSnapshot, stored_image: StoredImage):
     return (
         jsonify(
             snapshot_id=str(snapshot.id),
@@ -138,6 +213,136 @@ def create_snapshot():
     )
 
 
+@bp.post("/snapshot/presign")
+def presign_snapshot_upload():
+    """Return a presigned S3 form so a device can upload the image directly.
+
+    The device POSTs the image to ``url`` with ``fields``, then calls
+    ``/snapshot/confirm`` with the returned ``key`` to queue processing.
+    """
+
+    user_id = getattr(g, "user_id", None)
+    if user_id is None:
+        return jsonify(error="unauthorized"), 401
+
+    try:
+        storage = _get_snapshot_storage()
+    except RuntimeError as exc:
+        return jsonify(error=str(exc)), 503
+
+    payload = request.get_json(silent=True) or {}
+    app_config = current_app.extensions.get("app_config")
+    max_bytes = (
+        app_config.max_upload_bytes if app_config else 0
+    ) or DEFAULT_MAX_UPLOAD_BYTES
+    try:
+        upload = presign_image_upload(
+            storage,
+            user_id=str(user_id),
+            content_type=payload.get("contentType"),
+            max_bytes=max_bytes,
+        )
+    except ValueError as exc:
+        return jsonify(error=str(exc)), 400
+    except SnapshotStorageError as exc:
+        current_app.logger.exception("snapshot storage failure")
+        return jsonify(error=str(exc)), 502
+
+    return jsonify(
+        url=upload.url,
+        fields=upload.fields,
+        bucket=upload.bucket,
+        key=upload.key,
+        filename=upload.filename,
+        expiresIn=upload.expires_in,
+    )
+
+
+@bp.post("/snapshot/confirm")
+def confirm_snapshot_upload():
+    """Queue processing for an image uploaded through a presigned form."""
+
+    payload = request.get_json(silent=True) or {}
+
+    try:
+        storage = _get_snapshot_storage()
+        session = get_db_session()
+    except RuntimeError as exc:
+        return jsonify(error=str(exc)), 503
+
+    try:
+        user = load_current_user(session)
+        if user is None:
+            return jsonify(error="unauthorized"), 401
+
+        stored_image = confirm_presigned_upload(
+            storage, user_id=str(user.id), key=payload.get("key")
+        )
+        # Confirming the same upload twice returns the snapshot already queued.
+        # The transaction-scoped advisory lock serializes concurrent confirms
+        # of one key, so the second waits for the first commit and finds it.
+        lock_id = func.hashtextextended(stored_image.key, 0)
+        session.execute(select(func.pg_advisory_xact_lock(lock_id)))
+        snapshot = session.execute(
+            select(FridgeSnapshot)
+            .where(
+                FridgeSnapshot.user_id == user.id,
+                FridgeSnapshot.image_key == stored_image.key,
+            )
+            .limit(1)
+        ).scalar_one_or_none()
+        if snapshot is None:
+            snapshot = create_snapshot_request(
+                session=session,
+                user=user,
+                stored_image=stored_image,
+            )
+            session.commit()
+    except ValueError as exc:
+        session.rollback()
+        return jsonify(error=str(exc)), 400
+    except SnapshotStorageError as exc:
+        session.rollback()
+        current_app.logger.exception("snapshot storage failure")
+        return jsonify(error=str(exc)), 502
+    except SQLAlchemyError:
+        session.rollback()
+        current_app.logger.exception("failed to enqueue snapshot")
+        return jsonify(error="database failure while creating snapshot"), 500
+    finally:
+        session.close()
+
+    return _snapshot_accepted(snapshot, stored_image)
+
+
+# Fetch only the columns _serialize_snapshot reads, in one batched query per
+# relationship; raiseload turns any accidental lazy load into an error.
+_SNAPSHOT_LIST_LOAD_OPTIONS = (
+    load_only(FridgeSnapshot.id, FridgeSnapshot.created_at),
+    selectinload(FridgeSnapshot.items)
+    .load_only(SnapshotItem.product_id, SnapshotItem.quantity)
+    .selectinload(SnapshotItem.product)
+    .load_only(Product.name, Product.category),
+    raiseload("*"),
+)
+
+
+def _encode_cursor(snapshot: FridgeSnapshot) -> str:
+    raw = f"{snapshot.created_at.isoformat()}|{snapshot.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, _, snapshot_id = (
+            base64.urlsafe_b64decode(padded).decode().partition("|")
+        )
+        return datetime.fromisoformat(created_at), uuid.UUID(snapshot_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc
+
+
 @bp.get("/snapshots")
 def list_snapshots():
     """Return all snapshots for the authenticated user."""
@@ -156,25 +361,57 @@ def list_snapshots():
     limit = 5 if raw_limit is None else max(min(raw_limit, 50), 1)
     offset = 0 if raw_offset is None else max(raw_offset, 0)
 
+    # Keyset pagination: ``cursor`` seeks straight past the last row of the
+    # previous page, so deep pages cost the same as the first. ``offset`` is
+    # still accepted for older clients.
+    cursor = request.args.get("cursor") or None
+    after = None
+    if cursor is not None:
+        try:
+            after = _decode_cursor(cursor)
+        except ValueError as exc:
+            session.close()
+            return jsonify(error=str(exc)), 400
+        offset = 0
+
     try:
-        snapshot_rows = (
-            session.execute(
-                select(FridgeSnapshot)
-                .options(
-                    selectinload(FridgeSnapshot.items).selectinload(
-                        SnapshotItem.product
-                    )
-                )
-                .where(FridgeSnapshot.user_id == user_id)
-                .order_by(
-                    FridgeSnapshot.created_at.desc(), FridgeSnapshot.id.desc()
-                )
-                .offset(offset)
-                .limit(limit + 1)
+        # Any new, deleted or updated snapshot (including re-categorized
+        # contents) changes the count or the latest updated_at, so polls for
+        # an unchanged page are answered from this one aggregate.
+        snapshot_count, last_updated_at = session.execute(
+            select(func.count(), func.max(FridgeSnapshot.updated_at)).where(
+                FridgeSnapshot.user_id == user_id
+            )
+        ).one()
+        etag = "-".join(
+            (
+                str(user_id),
+                str(snapshot_count),
+                f"{last_updated_at.timestamp():.6f}" if last_updated_at else "0",
+                cursor or str(offset),
+                str(limit),
             )
-            .scalars()
-            .all()
         )
+        if request.if_none_match.contains_weak(etag):
+            return _with_list_cache_headers(
+                current_app.response_class(status=304), etag
+            )
+
+        page_query = (
+            select(FridgeSnapshot)
+            .options(*_SNAPSHOT_LIST_LOAD_OPTIONS)
+            .where(FridgeSnapshot.user_id == user_id)
+            .order_by(FridgeSnapshot.created_at.desc(), FridgeSnapshot.id.desc())
+            .limit(limit + 1)
+        )
+        if after is not None:
+            page_query = page_query.where(
+                tuple_(FridgeSnapshot.created_at, FridgeSnapshot.id)
+                < tuple_(*after)
+            )
+        elif offset:
+            page_query = page_query.offset(offset)
+        snapshot_rows = session.execute(page_query).scalars().all()
     except SQLAlchemyError:
         current_app.logger.exception(
             "failed to load snapshots for user", extra={"user_id": str(user_id)}
@@ -187,15 +424,30 @@ def list_snapshots():
     limited_snapshots = snapshot_rows[:limit]
     next_offset = offset + len(limited_snapshots)
 
-    return jsonify(
-        snapshots=[
-            _serialize_snapshot(snapshot) for snapshot in limited_snapshots
-        ],
-        hasMore=more_available,
-        nextOffset=next_offset,
+    image_url_template = _image_url_template()
+    return _with_list_cache_headers(
+        jsonify(
+            snapshots=[
+                _serialize_snapshot(snapshot, image_url_template)
+                for snapshot in limited_snapshots
+            ],
+            hasMore=more_available,
+            nextOffset=next_offset,
+            nextCursor=(
+                _encode_cursor(limited_snapshots[-1]) if more_available else None
+            ),
+        ),
+        etag,
     )
 
 
+def _with_list_cache_headers(response, etag: str):
+    response.set_etag(etag, weak=True)
+    # Clients poll for processing progress, so always revalidate.
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
 @bp.get("/snapshots/<uuid:snapshot_id>/image")
 def get_snapshot_image(snapshot_id: uuid.UUID):
     """Return the raw image bytes for a snapshot owned by the active user."""
@@ -239,8 +491,15 @@ def get_snapshot_image(snapshot_id: uuid.UUID):
     if snapshot is None:
         return jsonify(error="snapshot not found"), 404
 
+    # A snapshot's image never changes after upload, so revalidations can be
+    # answered from the row alone without touching S3.
+    if _image_not_modified(snapshot):
+        return _with_image_cache_headers(
+            current_app.response_class(status=304), snapshot
+        )
+
     try:
-        image_bytes = storage.fetch_image_bytes(
+        image = storage.open_image_stream(
             bucket=snapshot.image_bucket,
             key=snapshot.image_key,
         )
@@ -251,11 +510,34 @@ def get_snapshot_image(snapshot_id: uuid.UUID):
         )
         return jsonify(error=str(exc)), 502
 
-    mime_type, _ = mimetypes.guess_type(snapshot.image_filename)
-    response = send_file(
-        BytesIO(image_bytes),
+    # Relay the S3 body chunk by chunk so only one chunk is held per request
+    # and the first bytes go out as soon as S3 sends them.
+    mime_type = snapshot_image_content_type(snapshot)
+    response = current_app.response_class(
+        image.iter_chunks(),
         mimetype=mime_type or "application/octet-stream",
-        download_name=snapshot.image_filename,
+        direct_passthrough=True,
     )
-    response.headers["Cache-Control"] = "private, max-age=3600"
+    response.content_length = image.content_length
+    response.headers.set(
+        "Content-Disposition", "inline", filename=snapshot.image_filename
+    )
+    response.call_on_close(image.close)
+    return _with_image_cache_headers(response, snapshot)
+
+
+def _image_not_modified(snapshot: FridgeSnapshot) -> bool:
+    if request.if_none_match:
+        return request.if_none_match.contains(snapshot.id.hex)
+    if_modified_since = request.if_modified_since
+    return (
+        if_modified_since is not None
+        and if_modified_since >= snapshot.created_at.replace(microsecond=0)
+    )
+
+
+def _with_image_cache_headers(response, snapshot: FridgeSnapshot):
+    response.set_etag(snapshot.id.hex)
+    response.last_modified = snapshot.created_at
+    response.headers["Cache-Control"] = "private, max-age=86400, immutable"
     return response
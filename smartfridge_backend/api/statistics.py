@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
 from flask import Blueprint, current_app, g, jsonify
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
 
 from smartfridge_backend.api.deps import get_db_session
 from smartfridge_backend.models import (
     FridgeSnapshot,
+    Product,
     ProductCategory,
     SnapshotItem,
 )
@@ -17,9 +21,14 @@ from smartfridge_backend.models import (
 bp = Blueprint("statistics", __name__, url_prefix="/api/statistics")
 
 
+_CATEGORY_LABELS = ProductCategory.key_value_map()
+_CATEGORY_KEYS = tuple(_CATEGORY_LABELS)
+
+
+@lru_cache(maxsize=256)
 def _normalize_category_key(raw_category: str | None) -> str:
     normalized = (raw_category or "").strip().upper()
-    if normalized in ProductCategory.keys():
+    if normalized in _CATEGORY_LABELS:
         return normalized
     return "OTHER"
 
@@ -37,26 +46,26 @@ def ingredient_composition():
     if user_id is None:
         return jsonify(error="unauthorized"), 401
 
+    # Count items per (snapshot, stored category) in Postgres; the outer
+    # joins keep completed snapshots that have no items. Stored categories
+    # are free text, so several raw groups can fold into one bucket below.
     try:
-        snapshots = (
-            session.execute(
-                select(FridgeSnapshot)
-                .options(
-                    selectinload(FridgeSnapshot.items).selectinload(
-                        SnapshotItem.product
-                    )
-                )
-                .where(
-                    FridgeSnapshot.user_id == user_id,
-                    FridgeSnapshot.status == "complete",
-                )
-                .order_by(
-                    FridgeSnapshot.created_at.asc(), FridgeSnapshot.id.asc()
-                )
+        rows = session.execute(
+            select(
+                FridgeSnapshot.id,
+                FridgeSnapshot.created_at,
+                Product.category,
+                func.count(Product.id),
             )
-            .scalars()
-            .all()
-        )
+            .outerjoin(SnapshotItem, SnapshotItem.snapshot_id == FridgeSnapshot.id)
+            .outerjoin(Product, Product.id == SnapshotItem.product_id)
+            .where(
+                FridgeSnapshot.user_id == user_id,
+                FridgeSnapshot.status == "complete",
+            )
+            .group_by(FridgeSnapshot.id, Product.category)
+            .order_by(FridgeSnapshot.created_at.asc(), FridgeSnapshot.id.asc())
+        ).all()
     except SQLAlchemyError:
         current_app.logger.exception(
             "failed to load snapshots for ingredient composition statistics",
@@ -66,38 +75,26 @@ def ingredient_composition():
     finally:
         session.close()
 
-    category_labels = ProductCategory.key_value_map()
-    category_keys = list(category_labels.keys())
-
     payload_snapshots = []
-    for snapshot in snapshots:
-        category_counts = {key: 0 for key in category_keys}
-
-        for item in snapshot.items:
-            product = item.product
-            if product is None:
-                continue
-
-            category_key = _normalize_category_key(product.category)
-            category_counts[category_key] = category_counts.get(category_key, 0) + 1
+    for (snapshot_id, created_at), groups in groupby(rows, key=itemgetter(0, 1)):
+        category_counts = dict.fromkeys(_CATEGORY_KEYS, 0)
+        for _, _, raw_category, count in groups:
+            if count:
+                category_counts[_normalize_category_key(raw_category)] += count
 
         payload_snapshots.append(
             {
-                "snapshotId": str(snapshot.id),
-                "timestamp": snapshot.created_at.isoformat(),
+                "snapshotId": snapshot_id,
+                "timestamp": created_at,
                 "categoryCounts": [
-                    {
-                        "category": key,
-                        "label": category_labels.get(key),
-                        "count": category_counts.get(key, 0),
-                    }
-                    for key in category_keys
+                    {"category": key, "label": label, "count": category_counts[key]}
+                    for key, label in _CATEGORY_LABELS.items()
                 ],
                 "totalItems": sum(category_counts.values()),
             }
         )
 
     return jsonify(
-        categoryLabels=category_labels,
+        categoryLabels=_CATEGORY_LABELS,
         snapshots=payload_snapshots,
     )
@@ -2,5 +2,6 @@
 
 # LLM defaults are in a dedicated module for clarity and reuse.
 from .llm import DEFAULT_LLM_MODEL, DEFAULT_LLM_SYSTEM_PROMPT
+from .app import AppConfig
 
-__all__ = ["DEFAULT_LLM_MODEL", "DEFAULT_LLM_SYSTEM_PROMPT"]
+__all__ = ["AppConfig", "DEFAULT_LLM_MODEL", "DEFAULT_LLM_SYSTEM_PROMPT"]
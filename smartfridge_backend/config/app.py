@@ -0,0 +1,104 @@
+"""Runtime settings read from the environment when the app is created."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Optional
+
+from .llm import DEFAULT_LLM_MODEL, DEFAULT_LLM_SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_POOL_SIZE = 20
+DEFAULT_DB_MAX_OVERFLOW = 10
+DEFAULT_DB_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_S3_BASE_PREFIX = "snapshots"
+DEFAULT_MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class AppConfig:
+    """Snapshot of the environment variables consumed by ``create_app``."""
+
+    auth_secret: Optional[str] = None
+    storage_bucket: Optional[str] = None
+    storage_region: Optional[str] = None
+    storage_endpoint_url: Optional[str] = None
+    storage_base_prefix: str = DEFAULT_S3_BASE_PREFIX
+    aws_access_key_id: Optional[str] = None
+    aws_secret_access_key: Optional[str] = None
+    llm_api_key: Optional[str] = None
+    llm_model: str = DEFAULT_LLM_MODEL
+    llm_system_prompt: Optional[str] = DEFAULT_LLM_SYSTEM_PROMPT
+    spoonacular_api_key: Optional[str] = None
+    db_pool_size: int = DEFAULT_DB_POOL_SIZE
+    db_max_overflow: int = DEFAULT_DB_MAX_OVERFLOW
+    db_pool_recycle: int = DEFAULT_DB_POOL_RECYCLE_SECONDS
+    max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES
+    worker_concurrency: str = "1"
+    worker_disabled: bool = False
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "AppConfig":
+        """Read every setting once so later lookups are plain attributes."""
+
+        env = os.environ if environ is None else environ
+        return cls(
+            auth_secret=env.get("SMARTFRIDGE_AUTH_SECRET"),
+            storage_bucket=env.get("SMARTFRIDGE_S3_BUCKET"),
+            storage_region=env.get("SMARTFRIDGE_S3_REGION"),
+            storage_endpoint_url=env.get("SMARTFRIDGE_S3_ENDPOINT_URL"),
+            storage_base_prefix=env.get(
+                "SMARTFRIDGE_S3_BASE_PREFIX", DEFAULT_S3_BASE_PREFIX
+            ),
+            aws_access_key_id=env.get("AWS_ACCESS_KEY_ID"),
+            aws_secret_access_key=env.get("AWS_SECRET_ACCESS_KEY"),
+            llm_api_key=env.get("SMARTFRIDGE_LLM_API_KEY")
+            or env.get("OPENAI_API_KEY"),
+            llm_model=env.get("SMARTFRIDGE_LLM_MODEL", DEFAULT_LLM_MODEL),
+            llm_system_prompt=env.get(
+                "SMARTFRIDGE_LLM_SYSTEM_PROMPT", DEFAULT_LLM_SYSTEM_PROMPT
+            ),
+            spoonacular_api_key=env.get("SPOONACULAR_API_KEY"),
+            db_pool_size=_read_int(env, "DB_POOL_SIZE", DEFAULT_DB_POOL_SIZE),
+            db_max_overflow=_read_int(
+                env, "DB_MAX_OVERFLOW", DEFAULT_DB_MAX_OVERFLOW
+            ),
+            db_pool_recycle=_read_int(
+                env, "DB_POOL_RECYCLE", DEFAULT_DB_POOL_RECYCLE_SECONDS
+            ),
+            max_upload_bytes=_read_int(
+                env, "SMARTFRIDGE_MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES
+            ),
+            worker_concurrency=env.get("WORKER_CONCURRENCY", "1"),
+            worker_disabled=bool(env.get("SMARTFRIDGE_DISABLE_WORKER")),
+        )
+
+
+def _read_int(env: Mapping[str, str], name: str, default: int) -> int:
+    """Read a non-negative integer from the environment with a fallback."""
+
+    raw_value = env.get(name)
+    if raw_value is None:
+        return default
+
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning(
+            "Invalid %s=%r; falling back to default %s", name, raw_value, default
+        )
+        return default
+
+    if value < 0:
+        logger.warning(
+            "%s must not be negative; got %s. Falling back to default %s",
+            name,
+            value,
+            default,
+        )
+        return default
+    return value
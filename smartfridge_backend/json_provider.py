@@ -0,0 +1,45 @@
+"""Flask JSON provider backed by orjson."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialize responses and parse request bodies with orjson.
+
+    Values orjson does not handle natively (``Decimal``, ``date`` and the other
+    types Flask supports) still go through ``DefaultJSONProvider.default``.
+    Calls that pass ``json.dumps`` keyword arguments fall back to the stdlib
+    implementation so behaviour stays identical for them.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self._dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (
+            self.compact is None and self._app.debug
+        )
+        return self._app.response_class(
+            self._dumps_bytes(obj, pretty=pretty), mimetype=self.mimetype
+        )
+
+    def _dumps_bytes(self, obj: Any, *, pretty: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option)
@@ -10,8 +10,9 @@ from enum import Enum
 from typing import Any, Literal, Optional
 
 from sqlalchemy import (
-    CheckConstraint,
     DateTime,
+    Enum as SAEnum,
+    FetchedValue,
     ForeignKey,
     Index,
     Numeric,
@@ -45,7 +46,9 @@ class User(TimestampMixin, Base):
 
     __tablename__ = "users"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
     email: Mapped[str] = mapped_column(String(255), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[Optional[str]] = mapped_column(String(255))
@@ -55,7 +58,7 @@ class User(TimestampMixin, Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -73,7 +76,9 @@ class Product(Base):
 
     __tablename__ = "products"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     category: Mapped[Optional[str]] = mapped_column(String(120))
     unit: Mapped[Optional[str]] = mapped_column(String(32))
@@ -113,28 +118,45 @@ class FridgeSnapshot(TimestampMixin, Base):
 
     __tablename__ = "snapshots"
     __table_args__ = (
-        CheckConstraint(
-            "status in ('pending','processing','complete','failed')",
-            name="ck_snapshots_status",
+        Index(
+            "ix_snapshots_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
         ),
+        Index("ix_snapshots_user_created_at", "user_id", "created_at", "id"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
     )
     image_bucket: Mapped[str] = mapped_column(String(255), nullable=False)
     image_key: Mapped[str] = mapped_column(String(512), nullable=False)
     image_filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    image_content_type: Mapped[Optional[str]] = mapped_column(String(255))
     raw_llm_output: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[Literal["pending", "processing", "complete", "failed"]] = (
-        mapped_column(String(32), nullable=False, default="pending")
+        mapped_column(
+            SAEnum(
+                "pending",
+                "processing",
+                "complete",
+                "failed",
+                name="snapshot_status",
+            ),
+            nullable=False,
+            default="pending",
+        )
     )
     error: Mapped[Optional[str]] = mapped_column(Text)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -150,16 +172,23 @@ class SnapshotItem(Base):
     __tablename__ = "items"
     __table_args__ = (
         UniqueConstraint(
-            "snapshot_id", "product_id", name="uq_item_product"
+            "snapshot_id",
+            "product_id",
+            name="uq_item_product",
+            postgresql_include=["quantity"],
         ),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
     snapshot_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("snapshots.id", ondelete="CASCADE"), nullable=False
     )
     product_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("products.id", ondelete="RESTRICT"), nullable=False
+        ForeignKey("products.id", ondelete="RESTRICT"),
+        nullable=False,
+        index=True,
     )
     quantity: Mapped[Decimal] = mapped_column(
         Numeric(10, 2), nullable=False, default=Decimal("1.0")
@@ -180,19 +209,24 @@ class Job(Base):
             "snapshot_id",
             name="uq_jobs_snapshot_job_type",
         ),
-        CheckConstraint(
-            "status in ('queued','running','done','failed')",
-            name="ck_jobs_status",
-        ),
+        Index("ix_jobs_status_run_at", "status", "run_at"),
     )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True, default=uuid.uuid4, server_default=func.gen_random_uuid()
+    )
     job_type: Mapped[str] = mapped_column(String(64), nullable=False)
     snapshot_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("snapshots.id", ondelete="CASCADE"), nullable=False
+        ForeignKey("snapshots.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     status: Mapped[Literal["queued", "running", "done", "failed"]] = (
-        mapped_column(String(32), nullable=False, default="queued")
+        mapped_column(
+            SAEnum("queued", "running", "done", "failed", name="job_status"),
+            nullable=False,
+            default="queued",
+        )
     )
     attempts: Mapped[int] = mapped_column(nullable=False, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text)
@@ -207,7 +241,7 @@ class Job(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        server_onupdate=FetchedValue(),
         nullable=False,
     )
 
@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from typing import Any, Literal
 
 import jwt
 from flask import Response, current_app
+from werkzeug.http import dump_cookie
+
+from smartfridge_backend.services.cache import TTLCache
 
 AccessTokenType = Literal["access"]
 RefreshTokenType = Literal["refresh"]
@@ -24,10 +29,13 @@ DEFAULT_REFRESH_COOKIE_NAME = "sf_refresh"
 DEFAULT_COOKIE_PATH = "/"
 DEFAULT_COOKIE_SAMESITE: Literal["Lax", "Strict", "None"] = "Lax"
 DEFAULT_JWT_ALGORITHM = "HS256"
-
-
-def _now() -> datetime:
-    return datetime.now(timezone.utc)
+# A dedicated codec instance; jwt.encode/jwt.decode would route through
+# PyJWT's module-level global on every call.
+_jwt_codec = jwt.PyJWT()
+# Verified claims keyed by raw token, so a token reused across requests is
+# only signature-checked once per process until it expires.
+DECODED_TOKEN_CACHE_SIZE = 10_000
+_decoded_token_cache: TTLCache[dict[str, Any]] = TTLCache(DECODED_TOKEN_CACHE_SIZE)
 
 
 @dataclass(frozen=True)
@@ -44,6 +52,10 @@ class AuthSettings:
     cookie_secure: bool = True
     cookie_httponly: bool = True
     algorithm: str = DEFAULT_JWT_ALGORITHM
+    # Identify API callers from verified access-token claims alone instead of
+    # loading their user row on every request. Revocation is enforced when
+    # the short-lived access token is refreshed.
+    trust_access_claims: bool = True
 
     @classmethod
     def load(cls, app=None) -> "AuthSettings":
@@ -73,12 +85,65 @@ class AuthSettings:
             app=app,
         )
 
+        trust_access_claims = os.environ.get(
+            "SMARTFRIDGE_TRUST_ACCESS_CLAIMS", "true"
+        ).strip().lower() not in {"0", "false", "no", "off"}
+
         return cls(
             secret=secret,
             access_token_ttl=access_token_ttl,
             refresh_token_ttl=refresh_token_ttl,
+            trust_access_claims=trust_access_claims,
         )
 
+    @cached_property
+    def access_token_max_age(self) -> int:
+        """Access cookie lifetime in whole seconds."""
+
+        return int(self.access_token_ttl.total_seconds())
+
+    @cached_property
+    def refresh_token_max_age(self) -> int:
+        """Refresh cookie lifetime in whole seconds."""
+
+        return int(self.refresh_token_ttl.total_seconds())
+
+    @cached_property
+    def clear_cookie_headers(self) -> tuple[str, str]:
+        """``Set-Cookie`` values that expire both auth cookies."""
+
+        return tuple(
+            dump_cookie(
+                name,
+                "",
+                max_age=0,
+                expires=0,
+                path=self.cookie_path,
+                secure=self.cookie_secure,
+                httponly=self.cookie_httponly,
+                samesite=self.cookie_samesite,
+            )
+            for name in (self.access_cookie_name, self.refresh_cookie_name)
+        )
+
+
+def get_auth_settings(app=None) -> AuthSettings:
+    """Return auth settings, loading them once per application.
+
+    The environment does not change while a process runs, so the first
+    successful ``AuthSettings.load`` is kept on ``app.extensions``.
+    """
+
+    app = app or _try_get_current_app()
+    if app is None:
+        return AuthSettings.load()
+
+    settings = app.extensions.get("auth_settings")
+    if settings is None:
+        settings = AuthSettings.load(app)
+        app.extensions["auth_settings"] = settings
+    return settings
+
 
 @dataclass(frozen=True)
 class TokenPair:
@@ -98,38 +163,39 @@ def issue_token_pair(
 ) -> TokenPair:
     """Create signed access/refresh JWTs for the given user."""
 
-    settings = settings or AuthSettings.load()
-    now = _now()
+    settings = settings or get_auth_settings()
+    # JWT times are whole UNIX seconds, so work in ints from time.time().
+    issued_at = int(time.time())
     refresh_id = refresh_token_id or uuid.uuid4().hex
 
-    access_expires_at = now + settings.access_token_ttl
-    refresh_expires_at = now + settings.refresh_token_ttl
+    access_expires = issued_at + settings.access_token_max_age
+    refresh_expires = issued_at + settings.refresh_token_max_age
 
     access_payload = _build_access_payload(
         user_id=user_id,
         refresh_token_id=refresh_id,
-        expires_at=access_expires_at,
-        issued_at=now,
+        expires_at=access_expires,
+        issued_at=issued_at,
     )
     refresh_payload = _build_refresh_payload(
         user_id=user_id,
         token_id=refresh_id,
-        expires_at=refresh_expires_at,
-        issued_at=now,
+        expires_at=refresh_expires,
+        issued_at=issued_at,
     )
 
-    access_token = jwt.encode(
+    access_token = _jwt_codec.encode(
         access_payload, settings.secret, algorithm=settings.algorithm
     )
-    refresh_token = jwt.encode(
+    refresh_token = _jwt_codec.encode(
         refresh_payload, settings.secret, algorithm=settings.algorithm
     )
 
     return TokenPair(
         access_token=access_token,
         refresh_token=refresh_token,
-        access_expires_at=access_expires_at,
-        refresh_expires_at=refresh_expires_at,
+        access_expires_at=datetime.fromtimestamp(access_expires, timezone.utc),
+        refresh_expires_at=datetime.fromtimestamp(refresh_expires, timezone.utc),
         refresh_token_id=refresh_id,
     )
 
@@ -141,12 +207,20 @@ def decode_token(
 ) -> dict[str, Any]:
     """Decode and validate a JWT, optionally enforcing its declared type."""
 
-    settings = settings or AuthSettings.load()
-    payload = jwt.decode(
-        token,
-        settings.secret,
-        algorithms=[settings.algorithm],
-    )
+    settings = settings or get_auth_settings()
+    cache_key = (token, settings.secret, settings.algorithm)
+    payload = _decoded_token_cache.get(cache_key)
+    if payload is None:
+        # Invalid or expired tokens raise here and are never cached.
+        payload = _jwt_codec.decode(
+            token,
+            settings.secret,
+            algorithms=[settings.algorithm],
+        )
+        expires_at = payload.get("exp")
+        if isinstance(expires_at, (int, float)):
+            _decoded_token_cache.set(cache_key, payload, expires_at)
+    payload = dict(payload)
     token_type = payload.get("type")
     if expected_type and token_type != expected_type:
         raise ValueError(
@@ -160,11 +234,11 @@ def apply_auth_cookies(
 ) -> None:
     """Attach HttpOnly, Secure auth cookies carrying the issued tokens."""
 
-    settings = settings or AuthSettings.load()
+    settings = settings or get_auth_settings()
     response.set_cookie(
         settings.access_cookie_name,
         tokens.access_token,
-        max_age=int(settings.access_token_ttl.total_seconds()),
+        max_age=settings.access_token_max_age,
         expires=tokens.access_expires_at,
         path=settings.cookie_path,
         secure=settings.cookie_secure,
@@ -174,7 +248,7 @@ def apply_auth_cookies(
     response.set_cookie(
         settings.refresh_cookie_name,
         tokens.refresh_token,
-        max_age=int(settings.refresh_token_ttl.total_seconds()),
+        max_age=settings.refresh_token_max_age,
         expires=tokens.refresh_expires_at,
         path=settings.cookie_path,
         secure=settings.cookie_secure,
@@ -188,50 +262,38 @@ def clear_auth_cookies(
 ) -> None:
     """Remove access and refresh cookies from the response."""
 
-    settings = settings or AuthSettings.load()
-    response.delete_cookie(
-        settings.access_cookie_name,
-        path=settings.cookie_path,
-        samesite=settings.cookie_samesite,
-        secure=settings.cookie_secure,
-        httponly=settings.cookie_httponly,
-    )
-    response.delete_cookie(
-        settings.refresh_cookie_name,
-        path=settings.cookie_path,
-        samesite=settings.cookie_samesite,
-        secure=settings.cookie_secure,
-        httponly=settings.cookie_httponly,
-    )
+    settings = settings or get_auth_settings()
+    for header in settings.clear_cookie_headers:
+        response.headers.add("Set-Cookie", header)
 
 
 def _build_access_payload(
     user_id: uuid.UUID | str,
     refresh_token_id: str,
-    expires_at: datetime,
-    issued_at: datetime,
+    expires_at: int,
+    issued_at: int,
 ) -> dict[str, Any]:
     return {
         "sub": str(user_id),
         "type": "access",
         "refresh": refresh_token_id,
-        "iat": int(issued_at.timestamp()),
-        "exp": int(expires_at.timestamp()),
+        "iat": issued_at,
+        "exp": expires_at,
     }
 
 
 def _build_refresh_payload(
     user_id: uuid.UUID | str,
     token_id: str,
-    expires_at: datetime,
-    issued_at: datetime,
+    expires_at: int,
+    issued_at: int,
 ) -> dict[str, Any]:
     return {
         "sub": str(user_id),
         "type": "refresh",
         "jti": token_id,
-        "iat": int(issued_at.timestamp()),
-        "exp": int(expires_at.timestamp()),
+        "iat": issued_at,
+        "exp": expires_at,
     }
 
 
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import mimetypes
+import math
+import uuid
 from typing import Any
 
 from httpx import RequestError, TimeoutException
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -18,8 +20,11 @@ from smartfridge_backend.models import (
     User,
 )
 from smartfridge_backend.services.llm import VisionLLMClient
-from smartfridge_backend.services.normalization import normalize_product_name
-from smartfridge_backend.services.uploads import StoredImage
+from smartfridge_backend.services.normalization import normalize_product_names
+from smartfridge_backend.services.uploads import (
+    StoredImage,
+    resolve_image_content_type,
+)
 
 MAX_RAW_LLM_OUTPUT_BYTES = 16_000
 TRUNCATION_SUFFIX = " [truncated]"
@@ -47,6 +52,10 @@ def truncate_raw_llm_output(
     """Trim oversized LLM responses for storage."""
     if not raw_text:
         return None
+    # A code point is at most four UTF-8 bytes, so short text always fits
+    # without encoding it just to measure.
+    if len(raw_text) * 4 <= limit_bytes:
+        return raw_text
     encoded = raw_text.encode("utf-8")
     if len(encoded) <= limit_bytes:
         return raw_text
@@ -61,39 +70,69 @@ def truncate_raw_llm_output(
 def _parse_quantity(value: object) -> int:
     """Return a positive integer quantity derived from arbitrary input."""
 
-    if value is None:
-        return DEFAULT_ITEM_QUANTITY
-    quantity: int | None = None
-    if isinstance(value, bool):
-        quantity = int(value)
-    elif isinstance(value, int):
+    # Exact type checks keep the common case (the model returned an int) to a
+    # single comparison, and stop bools from being taken for ints.
+    value_type = type(value)
+    if value_type is int:
         quantity = value
-    elif isinstance(value, float):
-        quantity = int(value)
+    elif value_type is float:
+        quantity = _float_quantity(value)
     elif isinstance(value, str):
         candidate = value.strip()
-        if candidate:
+        if not candidate:
+            return DEFAULT_ITEM_QUANTITY
+        try:
+            quantity = int(candidate)
+        except ValueError:
             try:
-                quantity = int(candidate)
+                quantity = _float_quantity(float(candidate))
             except ValueError:
-                try:
-                    quantity = int(float(candidate))
-                except ValueError:
-                    quantity = None
-    if quantity is None:
+                return DEFAULT_ITEM_QUANTITY
+    elif value_type is bool:
+        quantity = int(value)
+    else:
         return DEFAULT_ITEM_QUANTITY
     return quantity if quantity > 0 else DEFAULT_ITEM_QUANTITY
 
 
-def _get_or_create_product(session: Session, name: str) -> Product:
-    product = session.execute(
-        select(Product).where(Product.name == name)
-    ).scalar_one_or_none()
-    if product is None:
-        product = Product(name=name)
-        session.add(product)
-        session.flush()
-    return product
+def _float_quantity(value: float) -> int:
+    # NaN and infinities cannot become ints; treat them like any bad value.
+    if not math.isfinite(value):
+        return DEFAULT_ITEM_QUANTITY
+    return int(value)
+
+
+def _get_or_create_product_ids(
+    session: Session, names: list[str]
+) -> dict[str, uuid.UUID]:
+    """Resolve product ids by name, inserting missing products in one batch."""
+
+    product_ids: dict[str, uuid.UUID] = dict(
+        session.execute(
+            select(Product.name, Product.id).where(Product.name.in_(names))
+        ).all()
+    )
+    missing = [name for name in names if name not in product_ids]
+    if not missing:
+        return product_ids
+
+    product_ids.update(
+        session.execute(
+            pg_insert(Product)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[Product.name])
+            .returning(Product.name, Product.id)
+        ).all()
+    )
+    # Rows another worker inserted since our SELECT come back from neither.
+    raced = [name for name in missing if name not in product_ids]
+    if raced:
+        product_ids.update(
+            session.execute(
+                select(Product.name, Product.id).where(Product.name.in_(raced))
+            ).all()
+        )
+    return product_ids
 
 
 def _add_snapshot_metadata(
@@ -102,17 +141,20 @@ def _add_snapshot_metadata(
     user: User,
     stored_image: StoredImage,
 ) -> FridgeSnapshot:
-    """Add a snapshot row to the session and flush so it has an id."""
+    """Add a snapshot row to the session with its id assigned up front."""
 
+    # Assigning the id here lets jobs and items reference the snapshot
+    # without a flush; every INSERT then goes out with the caller's commit.
     snapshot = FridgeSnapshot(
+        id=uuid.uuid4(),
         user_id=user.id,
         image_bucket=stored_image.bucket,
         image_key=stored_image.key,
         image_filename=stored_image.filename,
+        image_content_type=stored_image.content_type,
         status="pending",
     )
     session.add(snapshot)
-    session.flush()
     return snapshot
 
 
@@ -129,7 +171,9 @@ def create_snapshot_request(
         user=user,
         stored_image=stored_image,
     )
-    enqueue_snapshot_job(session=session, snapshot=snapshot)
+    # A brand-new snapshot cannot have a job yet, so skip the lookup that
+    # enqueue_snapshot_job needs for existing snapshots.
+    session.add(_new_snapshot_job(snapshot))
     return snapshot
 
 
@@ -151,13 +195,17 @@ def enqueue_snapshot_job(
     if existing_job:
         return existing_job
 
-    job = Job(
+    job = _new_snapshot_job(snapshot)
+    session.add(job)
+    return job
+
+
+def _new_snapshot_job(snapshot: FridgeSnapshot) -> Job:
+    return Job(
         job_type=PROCESS_SNAPSHOT_JOB_TYPE,
         snapshot_id=snapshot.id,
         status="queued",
     )
-    session.add(job)
-    return job
 
 
 def _add_snapshot_items(
@@ -166,25 +214,32 @@ def _add_snapshot_items(
     snapshot: FridgeSnapshot,
     normalized_payload: dict[str, Any],
 ) -> None:
-    if not normalized_payload:
-        return
+    payload_by_name: dict[str, Any] = {}
     for normalized_name, payload in normalized_payload.items():
         name = (normalized_name or "").strip()
-        if not name:
-            continue
-        product = _get_or_create_product(session, name)
+        if name:
+            payload_by_name[name] = payload
+    if not payload_by_name:
+        return
+
+    product_ids = _get_or_create_product_ids(session, list(payload_by_name))
+    rows = []
+    for name, payload in payload_by_name.items():
         if isinstance(payload, dict):
             quantity = _parse_quantity(payload.get("quantity"))
         else:
             quantity = _parse_quantity(payload)
-        session.add(
-            SnapshotItem(
-                snapshot_id=snapshot.id,
-                product_id=product.id,
-                quantity=quantity,
-                raw_payload=payload,
-            )
+        rows.append(
+            {
+                "snapshot_id": snapshot.id,
+                "product_id": product_ids[name],
+                "quantity": quantity,
+                "raw_payload": payload,
+            }
         )
+    # Nothing reads the item objects back, so skip the unit of work and send
+    # every row in one executemany.
+    session.execute(insert(SnapshotItem), rows)
 
 
 def _attach_raw_llm_output(
@@ -200,6 +255,14 @@ def _attach_raw_llm_output(
     snapshot.raw_llm_output = truncated
 
 
+def snapshot_image_content_type(snapshot: FridgeSnapshot) -> str | None:
+    """Return the stored image MIME type, guessing it for older rows."""
+
+    if snapshot.image_content_type:
+        return snapshot.image_content_type
+    return resolve_image_content_type(None, snapshot.image_filename)
+
+
 def _clear_snapshot_items(session: Session, snapshot: FridgeSnapshot) -> None:
     session.execute(
         delete(SnapshotItem).where(SnapshotItem.snapshot_id == snapshot.id)
@@ -216,7 +279,7 @@ def process_snapshot(
 ) -> None:
     """Run the image through the vision pipeline and persist results."""
 
-    mime_type, _ = mimetypes.guess_type(snapshot.image_filename)
+    mime_type = snapshot_image_content_type(snapshot)
 
     try:
         llm_result = llm_client.analyze_image(
@@ -237,11 +300,11 @@ def process_snapshot(
         raise IngestionLLMError("vision model did not return JSON output")
 
     normalized_payload = {
-        normalize_product_name(key): value
-        for key, value in parsed_json.items()
-    }
-    normalized_payload = {
-        key: value for key, value in normalized_payload.items() if key
+        key: value
+        for key, value in zip(
+            normalize_product_names(parsed_json), parsed_json.values()
+        )
+        if key
     }
 
     _attach_raw_llm_output(
@@ -6,9 +6,9 @@ import uuid
 from typing import TypedDict
 
 from sqlalchemy import select
-from sqlalchemy.orm import Session, selectinload, sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 
-from smartfridge_backend.models import FridgeSnapshot, SnapshotItem
+from smartfridge_backend.models import FridgeSnapshot, Product, SnapshotItem
 
 
 class InventoryItem(TypedDict):
@@ -27,43 +27,38 @@ def fetch_latest_items_for_user(
     When the user has never taken a snapshot, an empty list is returned.
     """
 
-    session: Session = session_factory()
-    try:
-        snapshot = (
-            session.execute(
-                select(FridgeSnapshot)
-                .options(
-                    selectinload(FridgeSnapshot.items).selectinload(
-                        SnapshotItem.product
-                    )
-                )
-                .where(
-                    FridgeSnapshot.user_id == user_id,
-                    FridgeSnapshot.status == "complete",
-                )
-                # Order by creation time so we pick the newest snapshot even if an older
-                # one finished processing later and has a later updated_at timestamp.
-                .order_by(FridgeSnapshot.created_at.desc())
-            )
-            .scalars()
-            .first()
+    # Resolve the newest completed snapshot and its named products in a single
+    # statement rather than one query per relationship.
+    latest_snapshot_id = (
+        select(FridgeSnapshot.id)
+        .where(
+            FridgeSnapshot.user_id == user_id,
+            FridgeSnapshot.status == "complete",
         )
+        # Order by creation time so we pick the newest snapshot even if an older
+        # one finished processing later and has a later updated_at timestamp.
+        .order_by(FridgeSnapshot.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    query = (
+        select(Product.name, SnapshotItem.quantity)
+        .join(SnapshotItem.product)
+        .where(
+            SnapshotItem.snapshot_id == latest_snapshot_id,
+            Product.name != "",
+        )
+    )
 
-        if snapshot is None:
-            return []
-
-        items: list[InventoryItem] = []
-        for item in snapshot.items:
-            product = item.product
-            if product is None or not product.name:
-                continue
-            items.append(
-                {
-                    "name": product.name,
-                    # Snapshot quantities are persisted as whole numbers.
-                    "quantity": max(int(item.quantity), 1),
-                }
-            )
-        return items
+    session: Session = session_factory()
+    try:
+        return [
+            {
+                "name": name,
+                # Snapshot quantities are persisted as whole numbers.
+                "quantity": max(int(quantity), 1),
+            }
+            for name, quantity in session.execute(query)
+        ]
     finally:
         session.close()
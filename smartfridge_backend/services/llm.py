@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import base64
+import hashlib
 import json
 import logging
+import time
 from dataclasses import dataclass
 from json import JSONDecodeError
 from typing import Any, Optional
@@ -13,8 +15,13 @@ from httpx import RequestError, TimeoutException
 from openai import OpenAI
 from openai.types.responses import Response
 
+from smartfridge_backend.services.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+VISION_RESULT_CACHE_SIZE = 128
+VISION_RESULT_CACHE_TTL_SECONDS = 24 * 60 * 60
+
 
 @dataclass
 class VisionLLMSettings:
@@ -33,6 +40,13 @@ class VisionLLMResult:
     parsed_json: Any | None
 
 
+# Parsed vision results keyed by image digest and request inputs, so a photo
+# that is uploaded or retried again skips the multi-second model call.
+_vision_result_cache: TTLCache[VisionLLMResult] = TTLCache(
+    VISION_RESULT_CACHE_SIZE
+)
+
+
 @dataclass
 class TextLLMSettings:
     """Configuration required to talk to a text-only model."""
@@ -60,8 +74,6 @@ class VisionLLMClient:
         if not image_bytes:
             raise ValueError("image_bytes is empty")
 
-        image_base64 = base64.b64encode(image_bytes).decode("ascii")
-
         user_text = (prompt or "").strip() or self._settings.system_prompt
         if not user_text:
             raise ValueError(
@@ -69,6 +81,18 @@ class VisionLLMClient:
             )
 
         mime = (mime_type or "image/jpeg").strip() or "image/jpeg"
+        cache_key = (
+            hashlib.sha256(image_bytes).digest(),
+            mime,
+            user_text,
+            self._settings.model,
+            self._settings.system_prompt,
+        )
+        cached = _vision_result_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        image_base64 = base64.b64encode(image_bytes).decode("ascii")
         data_uri = f"data:{mime};base64,{image_base64}"
 
         content = []
@@ -111,10 +135,16 @@ class VisionLLMClient:
             raise
 
         output_text = response.output_text
-        return VisionLLMResult(
+        result = VisionLLMResult(
             raw_text=output_text,
             parsed_json=self._attempt_json_parse(output_text),
         )
+        # Unparseable replies are not cached so a retry gets a fresh answer.
+        if result.parsed_json is not None:
+            _vision_result_cache.set(
+                cache_key, result, time.time() + VISION_RESULT_CACHE_TTL_SECONDS
+            )
+        return result
 
     @staticmethod
     def _attempt_json_parse(text: str) -> Any | None:
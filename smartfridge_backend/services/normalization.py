@@ -3,33 +3,37 @@
 from __future__ import annotations
 
 import re
-from typing import cast
+from functools import lru_cache
+from typing import Iterable, cast
 
 import inflect
 from inflect import Word
 
+_SEPARATORS_TO_SPACES = str.maketrans("_-", "  ")
 _NON_ALNUM_SPACE = re.compile(r"[^a-z0-9 ]+")
-_COLLAPSE_SPACES = re.compile(r"\s+")
 _INFLECT_ENGINE = inflect.engine()
 
 
+@lru_cache(maxsize=4096)
+def _singularize(word: str) -> str:
+    # inflect dominates normalization cost and fridge vocabularies are small,
+    # so each distinct trailing word is only singularized once.
+    return str(_INFLECT_ENGINE.singular_noun(cast(Word, word)) or word)
+
+
 def normalize_product_name(raw_name: str) -> str:
     """Normalize noisy fridge snapshot product names into a canonical form."""
 
-    normalized = raw_name.lower().strip()
-    if not normalized:
-        return normalized
+    normalized = raw_name.lower().translate(_SEPARATORS_TO_SPACES)
+    parts = _NON_ALNUM_SPACE.sub("", normalized).split()
+    if not parts:
+        return ""
 
-    normalized = normalized.replace("_", " ").replace("-", " ")
-    normalized = _NON_ALNUM_SPACE.sub("", normalized)
-    normalized = _COLLAPSE_SPACES.sub(" ", normalized).strip()
+    parts[-1] = _singularize(parts[-1])
+    return " ".join(parts)
 
-    if not normalized:
-        return normalized
 
-    parts = normalized.split(" ")
-    last_word = cast(Word, parts[-1])
-    singular = str(_INFLECT_ENGINE.singular_noun(last_word) or last_word)
-    parts[-1] = singular
+def normalize_product_names(raw_names: Iterable[str]) -> list[str]:
+    """Normalize a batch of names, e.g. every key of one vision response."""
 
-    return " ".join(parts)
+    return [normalize_product_name(raw_name) for raw_name in raw_names]
@@ -3,18 +3,33 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select, update
 from sqlalchemy.orm import Session
 
-from smartfridge_backend.models import Product
+from smartfridge_backend.models import FridgeSnapshot, Product, SnapshotItem
 from smartfridge_backend.models import ProductCategory
 from smartfridge_backend.services.llm import TextLLMClient
 
 logger = logging.getLogger(__name__)
 
 CATEGORY_UPDATE_BATCH_LIMIT = 20
+# Each batch is split into smaller prompts sent in parallel, so one update
+# costs roughly a single short LLM round trip instead of one long one.
+CATEGORY_PROMPT_CHUNK_SIZE = 5
+CATEGORY_MAX_CONCURRENCY = 4
+
+
+# The enum is fixed at import time, so the prompt's category block and the
+# set used to validate replies are built once rather than per chunk.
+_CATEGORY_KEYS = frozenset(ProductCategory.keys())
+_CATEGORY_ENTRIES = sorted(ProductCategory, key=lambda entry: entry.value)
+_CATEGORY_OPTIONS = "\n".join(
+    f"{entry.name}: {entry.value}" for entry in _CATEGORY_ENTRIES
+)
+_EXAMPLE_CATEGORY = _CATEGORY_ENTRIES[0].name
 
 
 class ProductCategorizationError(RuntimeError):
@@ -22,18 +37,13 @@ class ProductCategorizationError(RuntimeError):
 
 
 def _build_prompt(product_names: Iterable[str]) -> str:
-    category_entries = sorted(ProductCategory, key=lambda entry: entry.value)
-    category_options = "\n".join(
-        f"{entry.name}: {entry.value}" for entry in category_entries
-    )
-    example_category = category_entries[0].name
     formatted_names = "\n".join(f"- {name}" for name in product_names)
     prompt = (
         "Classify each grocery product into exactly one category.\n"
-        f"Available categories:\n{category_options}\n"
+        f"Available categories:\n{_CATEGORY_OPTIONS}\n"
         "Respond with a JSON object that maps the exact product name to a "
         "category enum. Do not add or omit products. Do not invent new categories. "
-        f"Example: {{\"apple\": \"{example_category}\"}}.\n"
+        f"Example: {{\"apple\": \"{_EXAMPLE_CATEGORY}\"}}.\n"
         "Products to categorize:\n"
         f"{formatted_names}\n"
         "Only output JSON."
@@ -49,7 +59,6 @@ def _parse_llm_payload(
         raise ValueError("LLM output must be a JSON object")
 
     updates: dict[str, str] = {}
-    valid_categories = ProductCategory.keys()
     for raw_name, raw_category in payload.items():
         if raw_name not in allowed_names:
             raise ValueError(f"unknown product returned: {raw_name!r}")
@@ -59,7 +68,7 @@ def _parse_llm_payload(
             )
 
         normalized_category = raw_category.strip().upper()
-        if normalized_category not in valid_categories:
+        if normalized_category not in _CATEGORY_KEYS:
             raise ValueError(
                 f"invalid category {raw_category!r} for {raw_name!r}"
             )
@@ -102,6 +111,49 @@ def categorize_products(
         raise ProductCategorizationError(str(exc)) from exc
 
 
+def categorize_products_concurrently(
+    llm_client: TextLLMClient,
+    product_names: list[str],
+    *,
+    chunk_size: int = CATEGORY_PROMPT_CHUNK_SIZE,
+    max_workers: int = CATEGORY_MAX_CONCURRENCY,
+) -> dict[str, str]:
+    """Categorize products in parallel chunks, keeping chunks that succeed.
+
+    Raises ``ProductCategorizationError`` only when every chunk failed.
+    """
+
+    chunk_size = max(chunk_size, 1)
+    chunks = [
+        product_names[start : start + chunk_size]
+        for start in range(0, len(product_names), chunk_size)
+    ]
+    if len(chunks) <= 1:
+        return categorize_products(llm_client, product_names)
+
+    updates: dict[str, str] = {}
+    last_error: ProductCategorizationError | None = None
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(chunks))),
+        thread_name_prefix="categorize",
+    ) as pool:
+        futures = [
+            pool.submit(categorize_products, llm_client, chunk) for chunk in chunks
+        ]
+        for chunk, future in zip(chunks, futures):
+            try:
+                updates.update(future.result())
+            except ProductCategorizationError as exc:
+                logger.warning(
+                    "category LLM failure for %d products: %s", len(chunk), exc
+                )
+                last_error = exc
+
+    if not updates and last_error is not None:
+        raise last_error
+    return updates
+
+
 def apply_categories_to_products(
     *,
     session: Session,
@@ -124,19 +176,35 @@ def apply_categories_to_products(
         return 0, 0
 
     product_names = [product.name for product in uncategorized_products]
-    updates = categorize_products(llm_client, product_names)
+    updates = categorize_products_concurrently(llm_client, product_names)
 
-    updated_count = 0
+    updated_ids = []
     for product in uncategorized_products:
         category = updates.get(product.name)
         if not category:
             continue
         product.category = category
-        updated_count += 1
+        updated_ids.append(product.id)
 
+    updated_count = len(updated_ids)
     if updated_count == 0:
         raise ProductCategorizationError(
             "LLM did not return categories for any products"
         )
 
+    # Snapshot listings show these categories; bump updated_at on the
+    # snapshots that contain the products so their cache validators change.
+    session.execute(
+        update(FridgeSnapshot)
+        .where(
+            FridgeSnapshot.id.in_(
+                select(SnapshotItem.snapshot_id).where(
+                    SnapshotItem.product_id.in_(updated_ids)
+                )
+            )
+        )
+        .values(updated_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+
     return updated_count, len(product_names)
@@ -0,0 +1,140 @@
+"""Helpers for talking to the Spoonacular recipe API."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Hashable, Iterable, Mapping, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from smartfridge_backend.services.cache import TTLCache
+from smartfridge_backend.services.inventory import InventoryItem
+
+logger = logging.getLogger(__name__)
+
+SPOONACULAR_BASE_URL = "https://api.spoonacular.com/"
+SPOONACULAR_PREWARM_TIMEOUT_SECONDS = 2
+SPOONACULAR_POOL_CONNECTIONS = 16
+SPOONACULAR_POOL_MAXSIZE = 32
+DEFAULT_RECIPE_LIMIT = 6
+RECIPE_CACHE_SIZE = 256
+RECIPE_CACHE_TTL_SECONDS = 15 * 60
+RECIPE_VALIDATOR_TTL_SECONDS = 24 * 60 * 60
+
+_ParamValue = str | bytes | int | float | bool | Sequence[str | bytes | int | float | bool]
+RequestParams = Mapping[str, _ParamValue]
+
+# Summarized Spoonacular matches keyed by the ingredient set, so repeat
+# lookups for an unchanged fridge skip the API round trip and its quota.
+_recipe_cache: TTLCache[list[dict[str, Any]]] = TTLCache(RECIPE_CACHE_SIZE)
+# Once a fresh entry expires, the last ETag lets us revalidate with a
+# conditional GET and reuse the matches on a 304 instead of a full body.
+_recipe_validators: TTLCache[tuple[str, list[dict[str, Any]]]] = TTLCache(
+    RECIPE_CACHE_SIZE
+)
+
+
+def init_spoonacular_session() -> requests.Session:
+    """Create a pooled HTTP session so Spoonacular calls reuse warm connections."""
+
+    session = requests.Session()
+    retries = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        # Hand the final 5xx back to the caller instead of raising.
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=SPOONACULAR_POOL_CONNECTIONS,
+            pool_maxsize=SPOONACULAR_POOL_MAXSIZE,
+            max_retries=retries,
+        ),
+    )
+    return session
+
+
+def prewarm_spoonacular_session(session: requests.Session) -> threading.Thread:
+    """Open a pooled connection in the background so the first recipe lookup
+    does not pay for the TCP and TLS handshakes."""
+
+    def _prewarm() -> None:
+        try:
+            session.head(
+                SPOONACULAR_BASE_URL,
+                allow_redirects=False,
+                timeout=SPOONACULAR_PREWARM_TIMEOUT_SECONDS,
+            )
+        except requests.RequestException as exc:
+            logger.debug("Spoonacular prewarm failed: %s", exc)
+
+    thread = threading.Thread(
+        target=_prewarm, name="spoonacular-prewarm", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def prepare_spoonacular_query(items: Iterable[InventoryItem]) -> RequestParams:
+    """Shape fridge items into the query params Spoonacular expects."""
+
+    # Quantities do not matter to Spoonacular; deduplicate names while
+    # preserving order to keep the query readable.
+    unique_ingredients = dict.fromkeys(
+        name for entry in items if (name := entry["name"].strip())
+    )
+
+    return {
+        "ingredients": ",".join(unique_ingredients),
+        "number": DEFAULT_RECIPE_LIMIT,
+        "ranking": 2,
+        "ignorePantry": True,
+    }
+
+
+def _recipe_cache_key(query: RequestParams) -> Hashable:
+    ingredients = str(query["ingredients"]).split(",")
+    return (
+        tuple(sorted(ingredients)),
+        query["number"],
+        query["ranking"],
+        query["ignorePantry"],
+    )
+
+
+def get_cached_recipes(query: RequestParams) -> Optional[list[dict[str, Any]]]:
+    """Return cached recipe matches for an equivalent query, if any."""
+
+    return _recipe_cache.get(_recipe_cache_key(query))
+
+
+def get_recipe_validator(
+    query: RequestParams,
+) -> Optional[tuple[str, list[dict[str, Any]]]]:
+    """Return the ``(etag, recipes)`` pair from the last full response."""
+
+    return _recipe_validators.get(_recipe_cache_key(query))
+
+
+def cache_recipes(
+    query: RequestParams,
+    recipes: list[dict[str, Any]],
+    *,
+    etag: str | None = None,
+) -> None:
+    """Remember recipe matches for ``query``; callers must not mutate them."""
+
+    key = _recipe_cache_key(query)
+    now = time.time()
+    _recipe_cache.set(key, recipes, expires_at=now + RECIPE_CACHE_TTL_SECONDS)
+    if etag:
+        _recipe_validators.set(
+            key, (etag, recipes), expires_at=now + RECIPE_VALIDATOR_TTL_SECONDS
+        )
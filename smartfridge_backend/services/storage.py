@@ -3,12 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import BinaryIO, Iterator, Optional
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import BaseClient
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
+# Bodies above the threshold go up as one multipart upload whose parts are
+# sent in parallel while the rest of the stream is still being read; smaller
+# photos stay a single PUT.
+MULTIPART_THRESHOLD = 16 * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_MAX_CONCURRENCY = 4
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Request threads, snapshot workers, multipart parts and streamed image
+# responses all share one client; botocore's default of 10 connections would
+# churn TLS handshakes once those overlap.
+S3_MAX_POOL_CONNECTIONS = 64
+
 
 @dataclass(slots=True)
 class SnapshotStorageSettings:
@@ -20,6 +34,25 @@ class SnapshotStorageSettings:
     base_prefix: str = "snapshots"
     access_key_id: Optional[str] = None
     secret_access_key: Optional[str] = None
+    multipart_threshold: int = MULTIPART_THRESHOLD
+    multipart_chunksize: int = UPLOAD_CHUNK_SIZE
+    max_upload_concurrency: int = UPLOAD_MAX_CONCURRENCY
+    max_pool_connections: int = S3_MAX_POOL_CONNECTIONS
+
+
+@dataclass(slots=True)
+class ImageStream:
+    """An open S3 object body that can be relayed to a client chunk by chunk."""
+
+    body: BinaryIO
+    content_length: int
+    content_type: Optional[str] = None
+
+    def iter_chunks(self, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        return iter(lambda: self.body.read(chunk_size), b"")
+
+    def close(self) -> None:
+        self.body.close()
 
 
 class SnapshotStorageError(RuntimeError):
@@ -37,6 +70,17 @@ class S3SnapshotStorage:
             endpoint_url=settings.endpoint_url,
             aws_access_key_id=settings.access_key_id,
             aws_secret_access_key=settings.secret_access_key,
+            config=Config(
+                max_pool_connections=settings.max_pool_connections,
+                tcp_keepalive=True,
+                retries={"mode": "standard"},
+            ),
+        )
+        self._transfer_config = TransferConfig(
+            multipart_threshold=settings.multipart_threshold,
+            multipart_chunksize=settings.multipart_chunksize,
+            max_concurrency=settings.max_upload_concurrency,
+            use_threads=True,
         )
 
     @property
@@ -53,7 +97,7 @@ class S3SnapshotStorage:
     ) -> str:
         """Persist the provided bytes and return the created object key."""
 
-        key = f"{self._settings.base_prefix}/user-{user_id}/{filename}"
+        key = self._object_key(user_id, filename)
         extra_args = {"ContentType": content_type} if content_type else None
 
         try:
@@ -70,6 +114,80 @@ class S3SnapshotStorage:
 
         return key
 
+    def store_image_stream(
+        self,
+        *,
+        user_id: str,
+        filename: str,
+        fileobj: BinaryIO,
+        content_type: str | None = None,
+    ) -> str:
+        """Stream a file-like object to S3 and return the created object key."""
+
+        key = self._object_key(user_id, filename)
+        extra_args = {"ContentType": content_type} if content_type else None
+
+        try:
+            self._client.upload_fileobj(
+                fileobj,
+                self._settings.bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=self._transfer_config,
+            )
+        except (BotoCoreError, ClientError) as exc:  # pragma: no cover - external
+            raise SnapshotStorageError("failed to write image to S3") from exc
+
+        return key
+
+    def presign_image_upload(
+        self,
+        *,
+        user_id: str,
+        filename: str,
+        content_type: str,
+        max_bytes: int,
+        expires_in: int = 300,
+    ) -> dict[str, object]:
+        """Return a presigned POST form the client can use to upload directly."""
+
+        key = self._object_key(user_id, filename)
+        try:
+            presigned = self._client.generate_presigned_post(
+                Bucket=self._settings.bucket,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_bytes],
+                ],
+                ExpiresIn=expires_in,
+            )
+        except (BotoCoreError, ClientError) as exc:  # pragma: no cover - external
+            raise SnapshotStorageError("failed to presign snapshot upload") from exc
+
+        return {"url": presigned["url"], "fields": presigned["fields"], "key": key}
+
+    def image_exists(self, *, key: str) -> bool:
+        """Return whether ``key`` exists in the configured bucket."""
+
+        try:
+            self._client.head_object(Bucket=self._settings.bucket, Key=key)
+        except ClientError as exc:
+            error_code = exc.response.get("Error", {}).get("Code")
+            if error_code in {"404", "NoSuchKey", "NotFound"}:
+                return False
+            raise SnapshotStorageError("failed to look up image in S3") from exc
+        except BotoCoreError as exc:  # pragma: no cover - external
+            raise SnapshotStorageError("failed to look up image in S3") from exc
+        return True
+
+    def user_key_prefix(self, user_id: str) -> str:
+        return f"{self._settings.base_prefix}/user-{user_id}/"
+
+    def _object_key(self, user_id: str, filename: str) -> str:
+        return f"{self.user_key_prefix(user_id)}{filename}"
+
     def fetch_image_bytes(
         self,
         *,
@@ -91,6 +209,32 @@ class S3SnapshotStorage:
             raise SnapshotStorageError("downloaded object was empty")
         return body
 
+    def open_image_stream(
+        self,
+        *,
+        bucket: str | None,
+        key: str,
+    ) -> ImageStream:
+        """Open an object for streaming without reading its body up front."""
+
+        try:
+            response = self._client.get_object(
+                Bucket=bucket or self._settings.bucket,
+                Key=key,
+            )
+        except (BotoCoreError, ClientError) as exc:  # pragma: no cover - external
+            raise SnapshotStorageError("failed to download image from S3") from exc
+
+        stream = ImageStream(
+            body=response["Body"],
+            content_length=response.get("ContentLength") or 0,
+            content_type=response.get("ContentType"),
+        )
+        if not stream.content_length:
+            stream.close()
+            raise SnapshotStorageError("downloaded object was empty")
+        return stream
+
     def build_image_url(
         self,
         *,
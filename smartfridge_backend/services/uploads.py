@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import mimetypes
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Tuple
+from typing import BinaryIO
 
 from werkzeug.datastructures import FileStorage
 from werkzeug.utils import secure_filename
@@ -20,6 +22,42 @@ class StoredImage:
     filename: str
     bucket: str
     key: str
+    content_type: str | None = None
+
+
+@dataclass(slots=True)
+class PresignedImageUpload:
+    """Presigned S3 form a device can POST the snapshot image to."""
+
+    url: str
+    fields: dict[str, str]
+    filename: str
+    bucket: str
+    key: str
+    expires_in: int
+
+
+PRESIGNED_UPLOAD_EXPIRES_IN = 300
+# Image types the app stores, serves inline and hands to the vision model.
+# Anything else a client declares is ignored in favour of the filename.
+ALLOWED_IMAGE_CONTENT_TYPES = frozenset(
+    {"image/jpeg", "image/png", "image/webp", "image/gif"}
+)
+
+
+def resolve_image_content_type(
+    declared: str | None, filename: str | None
+) -> str | None:
+    """Return an allowed image MIME type for an upload, or ``None``.
+
+    A client-declared type wins when it is an allowed image type; otherwise
+    the type is guessed from ``filename`` and kept only if it is allowed.
+    """
+
+    if declared in ALLOWED_IMAGE_CONTENT_TYPES:
+        return declared
+    guessed, _ = mimetypes.guess_type(filename or "")
+    return guessed if guessed in ALLOWED_IMAGE_CONTENT_TYPES else None
 
 
 def _build_unique_filename(original_name: str | None) -> str:
@@ -34,28 +72,133 @@ def save_image_upload(
     storage: S3SnapshotStorage,
     *,
     user_id: str | int,
-) -> Tuple[StoredImage, bytes]:
-    """Persist an uploaded image to S3 and return metadata plus the raw bytes."""
+) -> StoredImage:
+    """Stream a multipart upload to S3 and return where it was stored."""
 
     if image_file.filename == "":
         raise ValueError("empty filename")
 
-    image_bytes = image_file.read()
-    if not image_bytes:
+    # Werkzeug has already spooled the part; measure it without reading it
+    # into memory.
+    stream = image_file.stream
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    if not size:
         raise ValueError("uploaded file was empty")
 
-    filename = _build_unique_filename(image_file.filename)
+    return _store_stream(
+        stream,
+        storage,
+        user_id=user_id,
+        filename=_build_unique_filename(image_file.filename),
+        content_type=image_file.mimetype,
+    )
+
 
-    key = storage.store_image_bytes(
+def save_image_stream(
+    stream: BinaryIO,
+    storage: S3SnapshotStorage,
+    *,
+    user_id: str | int,
+    content_type: str | None,
+    content_length: int | None,
+) -> StoredImage:
+    """Stream a raw request body straight to S3 and return where it was stored."""
+
+    if not content_length:
+        raise ValueError("request body was empty")
+    if content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
+        raise ValueError("unsupported image content type")
+
+    extension = mimetypes.guess_extension(content_type) or ""
+    return _store_stream(
+        stream,
+        storage,
+        user_id=user_id,
+        filename=_build_unique_filename(f"snapshot{extension}"),
+        content_type=content_type,
+    )
+
+
+def _store_stream(
+    stream: BinaryIO,
+    storage: S3SnapshotStorage,
+    *,
+    user_id: str | int,
+    filename: str,
+    content_type: str | None,
+) -> StoredImage:
+    key = storage.store_image_stream(
         user_id=str(user_id),
         filename=filename,
-        image_bytes=image_bytes,
-        content_type=image_file.mimetype,
+        fileobj=stream,
+        content_type=content_type,
+    )
+    return StoredImage(
+        filename=filename,
+        bucket=storage.bucket,
+        key=key,
+        content_type=resolve_image_content_type(content_type, filename),
+    )
+
+
+def presign_image_upload(
+    storage: S3SnapshotStorage,
+    *,
+    user_id: str | int,
+    content_type: str | None,
+    max_bytes: int,
+) -> PresignedImageUpload:
+    """Reserve an object key and presign a direct-to-S3 upload for it."""
+
+    if content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
+        allowed = ", ".join(sorted(ALLOWED_IMAGE_CONTENT_TYPES))
+        raise ValueError(f"contentType must be one of {allowed}")
+
+    extension = mimetypes.guess_extension(content_type) or ""
+    filename = _build_unique_filename(f"snapshot{extension}")
+    presigned = storage.presign_image_upload(
+        user_id=str(user_id),
+        filename=filename,
+        content_type=content_type,
+        max_bytes=max_bytes,
+        expires_in=PRESIGNED_UPLOAD_EXPIRES_IN,
     )
+    return PresignedImageUpload(
+        url=presigned["url"],
+        fields=presigned["fields"],
+        filename=filename,
+        bucket=storage.bucket,
+        key=presigned["key"],
+        expires_in=PRESIGNED_UPLOAD_EXPIRES_IN,
+    )
+
 
-    stored_image = StoredImage(
+def confirm_presigned_upload(
+    storage: S3SnapshotStorage,
+    *,
+    user_id: str | int,
+    key: object,
+) -> StoredImage:
+    """Check a directly uploaded object belongs to the user and exists."""
+
+    if not isinstance(key, str):
+        raise ValueError("key must be a string")
+    prefix = storage.user_key_prefix(str(user_id))
+    if not key or not key.startswith(prefix):
+        raise ValueError("key does not belong to the current user")
+    filename = key[len(prefix):]
+    if not filename or "/" in filename:
+        raise ValueError("key does not belong to the current user")
+    if not storage.image_exists(key=key):
+        raise ValueError("uploaded image was not found")
+
+    # The presigned policy only accepted the content type the extension was
+    # derived from, so the filename maps back to it.
+    return StoredImage(
         filename=filename,
         bucket=storage.bucket,
         key=key,
+        content_type=resolve_image_content_type(None, filename),
     )
-    return stored_image, image_bytes
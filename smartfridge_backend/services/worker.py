@@ -229,25 +229,23 @@ class SnapshotJobWorker:
         if self._text_llm_client is None:
             return
 
-        session = self._session_factory()
+        # session.begin() commits the updates or rolls everything back on
+        # error; apply_categories_to_products raises when nothing was usable.
         try:
-            updated_count, total_products = apply_categories_to_products(
-                session=session,
-                llm_client=self._text_llm_client,
-                limit=CATEGORY_UPDATE_BATCH_LIMIT,
-            )
-
-            if total_products == 0:
-                return
-
-            if updated_count == 0:
-                session.rollback()
-                logger.warning(
-                    "LLM did not return categories for uncategorized products"
+            with self._session_factory() as session, session.begin():
+                updated_count, total_products = apply_categories_to_products(
+                    session=session,
+                    llm_client=self._text_llm_client,
+                    limit=CATEGORY_UPDATE_BATCH_LIMIT,
                 )
-                return
+        except ProductCategorizationError as exc:
+            logger.warning("category LLM failure: %s", exc)
+            return
+        except SQLAlchemyError:
+            logger.exception("failed to update product categories")
+            return
 
-            session.commit()
+        if total_products:
             logger.info(
                 "worker updated product categories",
                 extra={
@@ -255,14 +253,6 @@ class SnapshotJobWorker:
                     "total_products": total_products,
                 },
             )
-        except ProductCategorizationError as exc:
-            session.rollback()
-            logger.warning("category LLM failure: %s", exc)
-        except SQLAlchemyError:
-            session.rollback()
-            logger.exception("failed to update product categories")
-        finally:
-            session.close()
 
     def _handle_job_failure(self, job_id, exc: Exception) -> None:
         logger.warning("job %s failed: %s", job_id, exc)
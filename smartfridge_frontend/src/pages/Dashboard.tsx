@@ -8,7 +8,7 @@ const SNAPSHOT_PAGE_SIZE = 5
 type SnapshotResponse = {
   snapshots: Snapshot[]
   hasMore?: boolean
-  nextOffset?: number
+  nextCursor?: string | null
 }
 
 // const mockSnapshots: Snapshot[] = [...]
@@ -19,21 +19,20 @@ function Dashboard() {
   const [loadingMore, setLoadingMore] = useState(false)
   const [error, setError] = useState<string | null>(null)
   const [hasMore, setHasMore] = useState(true)
-  const [nextOffset, setNextOffset] = useState(0)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
 
-  const applyResponse = useCallback((response: SnapshotResponse, offset: number) => {
+  const applyResponse = useCallback((response: SnapshotResponse, append: boolean) => {
     const received = response.snapshots ?? []
     setSnapshots((prev) => {
-      const merged = offset === 0 ? received : [...prev, ...received]
+      const merged = append ? [...prev, ...received] : received
       return [...merged].sort((a, b) => {
         const aTime = new Date(a.timestamp).getTime() || 0
         const bTime = new Date(b.timestamp).getTime() || 0
         return bTime - aTime
       })
     })
-    const calculatedNextOffset = response.nextOffset ?? offset + received.length
-    setNextOffset(calculatedNextOffset)
-    setHasMore(response.hasMore ?? received.length === SNAPSHOT_PAGE_SIZE)
+    setNextCursor(response.nextCursor ?? null)
+    setHasMore(Boolean(response.hasMore && response.nextCursor))
   }, [])
 
   const loadInitialSnapshots = useCallback(async () => {
@@ -41,9 +40,9 @@ function Dashboard() {
     setError(null)
     try {
       const response = await apiClient.request<SnapshotResponse>(
-        `/snapshots?limit=${SNAPSHOT_PAGE_SIZE}&offset=0`,
+        `/snapshots?limit=${SNAPSHOT_PAGE_SIZE}`,
       )
-      applyResponse(response, 0)
+      applyResponse(response, false)
     } catch (err) {
       const message = err instanceof Error ? err.message : 'Failed to load snapshots'
       setError(message)
@@ -53,13 +52,13 @@ function Dashboard() {
   }, [applyResponse])
 
   const loadMoreSnapshots = useCallback(async () => {
-    if (loading || loadingMore || !hasMore) return
+    if (loading || loadingMore || !hasMore || !nextCursor) return
     setLoadingMore(true)
     try {
       const response = await apiClient.request<SnapshotResponse>(
-        `/snapshots?limit=${SNAPSHOT_PAGE_SIZE}&offset=${nextOffset}`,
+        `/snapshots?limit=${SNAPSHOT_PAGE_SIZE}&cursor=${encodeURIComponent(nextCursor)}`,
       )
-      applyResponse(response, nextOffset)
+      applyResponse(response, true)
       setError(null)
     } catch (err) {
       const message = err instanceof Error ? err.message : 'Failed to load more snapshots'
@@ -67,7 +66,7 @@ function Dashboard() {
     } finally {
       setLoadingMore(false)
     }
-  }, [applyResponse, hasMore, loading, loadingMore, nextOffset])
+  }, [applyResponse, hasMore, loading, loadingMore, nextCursor])
 
   useEffect(() => {
     loadInitialSnapshots()
@@ -0,0 +1,40 @@
+import unittest
+
+from smartfridge_backend.config import AppConfig, DEFAULT_LLM_MODEL
+from smartfridge_backend.config.app import DEFAULT_DB_POOL_SIZE
+
+
+class AppConfigTests(unittest.TestCase):
+    def test_defaults_when_environment_is_empty(self):
+        config = AppConfig.from_env({})
+
+        self.assertIsNone(config.auth_secret)
+        self.assertIsNone(config.storage_bucket)
+        self.assertEqual(config.storage_base_prefix, "snapshots")
+        self.assertEqual(config.llm_model, DEFAULT_LLM_MODEL)
+        self.assertIsNone(config.spoonacular_api_key)
+        self.assertEqual(config.db_pool_size, DEFAULT_DB_POOL_SIZE)
+        self.assertEqual(config.worker_concurrency, "1")
+        self.assertFalse(config.worker_disabled)
+
+    def test_llm_api_key_falls_back_to_openai_key(self):
+        config = AppConfig.from_env({"OPENAI_API_KEY": "sk-openai"})
+        self.assertEqual(config.llm_api_key, "sk-openai")
+
+        config = AppConfig.from_env(
+            {"OPENAI_API_KEY": "sk-openai", "SMARTFRIDGE_LLM_API_KEY": "sk-sf"}
+        )
+        self.assertEqual(config.llm_api_key, "sk-sf")
+
+    def test_invalid_pool_settings_fall_back_to_defaults(self):
+        for raw_value in ("not-a-number", "-5"):
+            with self.subTest(raw_value=raw_value):
+                with self.assertLogs("smartfridge_backend.config.app", "WARNING"):
+                    config = AppConfig.from_env({"DB_POOL_SIZE": raw_value})
+                self.assertEqual(config.db_pool_size, DEFAULT_DB_POOL_SIZE)
+
+        self.assertEqual(AppConfig.from_env({"DB_POOL_SIZE": "3"}).db_pool_size, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
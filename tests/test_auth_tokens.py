@@ -4,8 +4,10 @@ from datetime import timedelta
 from http.cookies import SimpleCookie
 from unittest import mock
 
+import jwt
 from flask import Flask, make_response
 
+from smartfridge_backend.services import auth_tokens
 from smartfridge_backend.services.auth_tokens import (
     AuthSettings,
     apply_auth_cookies,
@@ -13,6 +15,7 @@ from smartfridge_backend.services.auth_tokens import (
     decode_token,
     DEFAULT_ACCESS_TOKEN_TTL,
     DEFAULT_REFRESH_TOKEN_TTL,
+    get_auth_settings,
     issue_token_pair,
 )
 
@@ -24,6 +27,7 @@ class AuthTokenTests(unittest.TestCase):
             access_token_ttl=timedelta(minutes=5),
             refresh_token_ttl=timedelta(days=7),
         )
+        auth_tokens._decoded_token_cache.clear()
 
     def test_issue_and_decode_tokens(self):
         tokens = issue_token_pair("user-123", settings=self.settings)
@@ -102,6 +106,36 @@ class AuthTokenTests(unittest.TestCase):
                 cleared[self.settings.refresh_cookie_name]["max-age"], "0"
             )
 
+    def test_decode_token_verifies_each_token_once(self):
+        tokens = issue_token_pair("user-123", settings=self.settings)
+
+        with mock.patch.object(
+            auth_tokens._jwt_codec, "decode", wraps=auth_tokens._jwt_codec.decode
+        ) as decode:
+            first = decode_token(
+                tokens.access_token, self.settings, expected_type="access"
+            )
+            first["sub"] = "tampered"
+            second = decode_token(
+                tokens.access_token, self.settings, expected_type="access"
+            )
+            with self.assertRaises(ValueError):
+                decode_token(
+                    tokens.access_token, self.settings, expected_type="refresh"
+                )
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(second["sub"], "user-123")
+
+    def test_decode_token_does_not_cache_invalid_tokens(self):
+        tokens = issue_token_pair("user-123", settings=self.settings)
+        other_settings = AuthSettings(secret="other-secret")
+
+        for _ in range(2):
+            with self.assertRaises(jwt.InvalidSignatureError):
+                decode_token(tokens.access_token, other_settings)
+        self.assertEqual(len(auth_tokens._decoded_token_cache), 0)
+
     @mock.patch.dict(
         os.environ,
         {
@@ -131,6 +165,21 @@ class AuthTokenTests(unittest.TestCase):
         self.assertEqual(settings.access_token_ttl, DEFAULT_ACCESS_TOKEN_TTL)
         self.assertEqual(settings.refresh_token_ttl, DEFAULT_REFRESH_TOKEN_TTL)
 
+    def test_get_auth_settings_loads_once_per_app(self):
+        app = Flask(__name__)
+        app.config["AUTH_SECRET"] = "app-secret"
+
+        with app.app_context():
+            with mock.patch.object(
+                AuthSettings, "load", wraps=AuthSettings.load
+            ) as load:
+                first = get_auth_settings()
+                second = get_auth_settings()
+
+        self.assertIs(first, second)
+        self.assertEqual(first.secret, "app-secret")
+        self.assertEqual(load.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from smartfridge_backend.services.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TTLCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = TTLCache(maxsize=2, clock=self.clock)
+
+    def test_entries_expire_at_their_deadline(self):
+        self.cache.set("token", {"sub": "a"}, expires_at=self.clock.now + 10)
+        self.assertEqual(self.cache.get("token"), {"sub": "a"})
+
+        self.clock.now += 10
+        self.assertIsNone(self.cache.get("token"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_already_expired_values_are_not_stored(self):
+        self.cache.set("token", {"sub": "a"}, expires_at=self.clock.now)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        deadline = self.clock.now + 60
+        self.cache.set("a", 1, deadline)
+        self.cache.set("b", 2, deadline)
+        self.cache.get("a")
+        self.cache.set("c", 3, deadline)
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("c"), 3)
+
+    def test_discard_removes_entry(self):
+        self.cache.set("a", 1, self.clock.now + 60)
+        self.cache.discard("a")
+        self.cache.discard("missing")
+        self.assertIsNone(self.cache.get("a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
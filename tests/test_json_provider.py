@@ -0,0 +1,52 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from flask import Flask, jsonify
+
+from smartfridge_backend.json_provider import OrjsonProvider
+
+
+class OrjsonProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+
+    def test_jsonify_serializes_common_types(self):
+        snapshot_id = uuid.uuid4()
+        with self.app.app_context():
+            response = jsonify(
+                id=snapshot_id,
+                quantity=Decimal("1.5"),
+                counts={1: "one"},
+                at=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            )
+
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(
+            response.get_json(),
+            {
+                "at": "2024-01-02T03:04:05+00:00",
+                "counts": {"1": "one"},
+                "id": str(snapshot_id),
+                "quantity": "1.5",
+            },
+        )
+
+    def test_request_bodies_are_parsed(self):
+        with self.app.test_request_context(
+            json={"email": "a@example.com", "password": "hunter2"}
+        ) as ctx:
+            self.assertEqual(
+                ctx.request.get_json()["email"], "a@example.com"
+            )
+
+        with self.app.test_request_context(
+            data="{not json", content_type="application/json"
+        ) as ctx:
+            self.assertIsNone(ctx.request.get_json(silent=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
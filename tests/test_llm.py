@@ -0,0 +1,59 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from smartfridge_backend.services import llm
+from smartfridge_backend.services.llm import VisionLLMClient, VisionLLMSettings
+
+
+class _FakeResponses:
+    def __init__(self, output_text):
+        self.output_text = output_text
+        self.calls = 0
+
+    def create(self, **_kwargs):
+        self.calls += 1
+        return SimpleNamespace(output_text=self.output_text)
+
+
+class VisionResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        llm._vision_result_cache.clear()
+
+    def _client(self, output_text):
+        client = VisionLLMClient(VisionLLMSettings(api_key="test-key"))
+        responses = _FakeResponses(output_text)
+        client._client = SimpleNamespace(responses=responses)
+        return client, responses
+
+    def test_repeat_image_and_prompt_reuses_result(self):
+        client, responses = self._client('{"milk": {"quantity": 1}}')
+
+        first = client.analyze_image(image_bytes=b"img", prompt="list items")
+        second = client.analyze_image(image_bytes=b"img", prompt="list items")
+        client.analyze_image(image_bytes=b"other", prompt="list items")
+        client.analyze_image(image_bytes=b"img", prompt="count items")
+
+        self.assertIs(second, first)
+        self.assertEqual(responses.calls, 3)
+
+    def test_cache_hit_skips_base64_encoding(self):
+        client, _ = self._client('{"milk": {"quantity": 1}}')
+        client.analyze_image(image_bytes=b"img", prompt="list items")
+
+        with mock.patch.object(
+            llm.base64, "b64encode", side_effect=AssertionError("encoded")
+        ):
+            client.analyze_image(image_bytes=b"img", prompt="list items")
+
+    def test_unparseable_output_is_not_cached(self):
+        client, responses = self._client("no json here")
+
+        client.analyze_image(image_bytes=b"img", prompt="list items")
+        client.analyze_image(image_bytes=b"img", prompt="list items")
+
+        self.assertEqual(responses.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,9 @@
 import unittest
 
-from smartfridge_backend.services.normalization import normalize_product_name
+from smartfridge_backend.services.normalization import (
+    normalize_product_name,
+    normalize_product_names,
+)
 
 
 class NormalizeProductNameTests(unittest.TestCase):
@@ -17,6 +20,17 @@ class NormalizeProductNameTests(unittest.TestCase):
             with self.subTest(raw=raw):
                 self.assertEqual(normalize_product_name(raw), expected)
 
+    def test_names_without_letters_or_digits_normalize_to_empty(self):
+        for raw in ("", "   ", "!!", "__", "-"):
+            with self.subTest(raw=raw):
+                self.assertEqual(normalize_product_name(raw), "")
+
+    def test_batch_preserves_order(self):
+        self.assertEqual(
+            normalize_product_names(["Oranges", "!!", "red_pepper"]),
+            ["orange", "", "red pepper"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
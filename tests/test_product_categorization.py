@@ -0,0 +1,56 @@
+import re
+import threading
+import unittest
+
+from smartfridge_backend.services.llm import VisionLLMResult
+from smartfridge_backend.services.product_categorization import (
+    ProductCategorizationError,
+    categorize_products_concurrently,
+)
+
+
+class _FakeTextClient:
+    """Answers every listed product with DAIRY, failing prompts naming 'bad'."""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+        self._lock = threading.Lock()
+
+    def run_prompt(self, *, prompt, system_prompt=None):
+        with self._lock:
+            self.prompts.append(prompt)
+        names = re.findall(r"^- (.+)$", prompt, flags=re.MULTILINE)
+        if "bad" in names:
+            return VisionLLMResult(raw_text="oops", parsed_json=None)
+        payload = {name: "DAIRY" for name in names}
+        return VisionLLMResult(raw_text=str(payload), parsed_json=payload)
+
+
+class CategorizeProductsConcurrentlyTests(unittest.TestCase):
+    def test_splits_names_into_chunks(self):
+        client = _FakeTextClient()
+        names = [f"p{idx}" for idx in range(7)]
+
+        updates = categorize_products_concurrently(client, names, chunk_size=3)
+
+        self.assertEqual(updates, {name: "DAIRY" for name in names})
+        self.assertEqual(len(client.prompts), 3)
+
+    def test_keeps_successful_chunks_when_one_fails(self):
+        client = _FakeTextClient()
+
+        updates = categorize_products_concurrently(
+            client, ["milk", "bad", "eggs", "cheese"], chunk_size=2
+        )
+
+        self.assertEqual(updates, {"eggs": "DAIRY", "cheese": "DAIRY"})
+
+    def test_raises_when_every_chunk_fails(self):
+        with self.assertRaises(ProductCategorizationError):
+            categorize_products_concurrently(
+                _FakeTextClient(), ["bad", "bad"], chunk_size=1
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
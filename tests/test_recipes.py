@@ -0,0 +1,81 @@
+import unittest
+
+from smartfridge_backend.services import recipes
+from smartfridge_backend.services.recipes import (
+    DEFAULT_RECIPE_LIMIT,
+    cache_recipes,
+    get_cached_recipes,
+    get_recipe_validator,
+    prepare_spoonacular_query,
+)
+
+
+class PrepareSpoonacularQueryTests(unittest.TestCase):
+    def test_deduplicates_names_in_order_and_skips_blanks(self):
+        query = prepare_spoonacular_query(
+            [
+                {"name": " milk", "quantity": 20},
+                {"name": "eggs", "quantity": 0},
+                {"name": "milk ", "quantity": 1},
+                {"name": "  ", "quantity": 3},
+            ]
+        )
+
+        self.assertEqual(query["ingredients"], "milk,eggs")
+        self.assertEqual(query["number"], DEFAULT_RECIPE_LIMIT)
+        self.assertIs(query["ignorePantry"], True)
+
+
+class RecipeCacheTests(unittest.TestCase):
+    def setUp(self):
+        recipes._recipe_cache.clear()
+        recipes._recipe_validators.clear()
+
+    def test_hit_ignores_ingredient_order(self):
+        matches = [{"title": "Omelette"}]
+        cache_recipes(
+            prepare_spoonacular_query(
+                [{"name": "milk", "quantity": 1}, {"name": "eggs", "quantity": 2}]
+            ),
+            matches,
+        )
+
+        cached = get_cached_recipes(
+            prepare_spoonacular_query(
+                [{"name": "eggs", "quantity": 6}, {"name": "milk", "quantity": 1}]
+            )
+        )
+
+        self.assertIs(cached, matches)
+
+    def test_different_ingredients_miss(self):
+        cache_recipes(
+            prepare_spoonacular_query([{"name": "milk", "quantity": 1}]),
+            [{"title": "Latte"}],
+        )
+
+        self.assertIsNone(
+            get_cached_recipes(
+                prepare_spoonacular_query([{"name": "eggs", "quantity": 1}])
+            )
+        )
+
+    def test_validator_outlives_fresh_entry(self):
+        query = prepare_spoonacular_query([{"name": "milk", "quantity": 1}])
+        matches = [{"title": "Latte"}]
+        cache_recipes(query, matches, etag='"v1"')
+
+        recipes._recipe_cache.clear()
+
+        self.assertIsNone(get_cached_recipes(query))
+        self.assertEqual(get_recipe_validator(query), ('"v1"', matches))
+
+    def test_responses_without_etag_store_no_validator(self):
+        query = prepare_spoonacular_query([{"name": "milk", "quantity": 1}])
+        cache_recipes(query, [{"title": "Latte"}])
+
+        self.assertIsNone(get_recipe_validator(query))
+
+
+if __name__ == "__main__":
+    unittest.main()
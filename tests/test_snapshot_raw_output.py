@@ -1,7 +1,9 @@
 import unittest
 
 from smartfridge_backend.services.ingestion import (
+    DEFAULT_ITEM_QUANTITY,
     TRUNCATION_SUFFIX,
+    _parse_quantity,
     truncate_raw_llm_output,
 )
 
@@ -25,5 +27,21 @@ class TruncateRawLLMOutputTests(unittest.TestCase):
         self.assertLessEqual(len(result.encode("utf-8")), limit)
 
 
+class ParseQuantityTests(unittest.TestCase):
+    def test_accepts_positive_numbers_and_numeric_strings(self):
+        self.assertEqual(_parse_quantity(3), 3)
+        self.assertEqual(_parse_quantity(2.9), 2)
+        self.assertEqual(_parse_quantity(" 4 "), 4)
+        self.assertEqual(_parse_quantity("2.5"), 2)
+
+    def test_falls_back_to_default_for_unusable_values(self):
+        for value in (None, 0, -2, False, "", "lots", "nan", "inf", [], 0.4):
+            with self.subTest(value=value):
+                self.assertEqual(_parse_quantity(value), DEFAULT_ITEM_QUANTITY)
+
+    def test_true_counts_as_one(self):
+        self.assertEqual(_parse_quantity(True), 1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from smartfridge_backend.services.uploads import resolve_image_content_type
+
+
+class ResolveImageContentTypeTests(unittest.TestCase):
+    def test_keeps_declared_image_type(self):
+        self.assertEqual(
+            resolve_image_content_type("image/png", "photo.jpg"), "image/png"
+        )
+
+    def test_guesses_from_filename_when_declared_type_is_not_allowed(self):
+        for declared in (None, "application/octet-stream", "text/html"):
+            with self.subTest(declared=declared):
+                self.assertEqual(
+                    resolve_image_content_type(declared, "photo.jpg"),
+                    "image/jpeg",
+                )
+
+    def test_returns_none_when_nothing_is_an_allowed_image(self):
+        self.assertIsNone(resolve_image_content_type("image/svg+xml", "x.svg"))
+        self.assertIsNone(resolve_image_content_type("text/html", "x.html"))
+        self.assertIsNone(resolve_image_content_type(None, "snapshot"))
+
+
+if __name__ == "__main__":
+    unittest.main()